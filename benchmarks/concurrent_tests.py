@@ -0,0 +1,84 @@
+"""Measures how much running the tests of a model on several threads speeds up `check_tests`.
+
+Usage:
+    python benchmarks/concurrent_tests.py --columns 60 --latency 0.2 --test-threads 8
+
+No database is needed: a fake connector sleeps for `--latency` seconds for every test query, which
+stands for the round trip to a warehouse. It can't check all the tests in a single query so they
+are checked one after the other, like they used to be, then with `--test-threads` of them running
+at once.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from sqlalchemy.exc import DBAPIError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dbt_sugar.core.task.doc import DocumentationTask  # noqa: E402
+
+TESTS = ["unique", "not_null"]
+
+
+class _SugarConfig:
+    dbt_project_info = {"excluded_folders": [], "excluded_models": []}
+
+
+class _Flags:
+    lazy = True
+    use_cache = False
+
+    def __init__(self, test_threads: int) -> None:
+        self.test_threads = test_threads
+
+
+class _Connector:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def count_tests_failures(
+        self, schema: str, table: str, tests: List[Tuple[str, str]]
+    ) -> List[int]:
+        # like a database refusing the single query, so that tests are checked one by one.
+        raise DBAPIError("select", {}, Exception())
+
+    def count_test_failures(self, test_name: str, schema: str, table: str, column: str) -> int:
+        time.sleep(self.latency)
+        return 0
+
+
+def _time_check_tests(project_path: Path, test_threads: int, columns: int, latency: float) -> float:
+    task = DocumentationTask(_Flags(test_threads), None, _SugarConfig(), project_path)  # type: ignore
+    task.connector = _Connector(latency)  # type: ignore
+    task.column_update_payload = {
+        f"column_{column}": {"tests": list(TESTS)} for column in range(columns)
+    }
+    start = time.perf_counter()
+    task.check_tests("public", "model")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Times the tests of a synthetic model checked serially and on several threads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--columns", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per test query.")
+    parser.add_argument("--test-threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        print(f"Synthetic model: {args.columns} columns, {len(TESTS)} tests per column")
+        serial = _time_check_tests(Path(folder), 1, args.columns, args.latency)
+        threaded = _time_check_tests(Path(folder), args.test_threads, args.columns, args.latency)
+        print(f"          1 thread: {serial:6.2f}s")
+        print(
+            f"{args.test_threads:>10} threads: {threaded:6.2f}s ({serial / threaded:.1f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measures how much checking all the tests of a model in a single query speeds things up.
+
+Usage:
+    python benchmarks/fused_tests.py --rows 500000 --columns 20
+
+A synthetic table is written to a temporary SQLite database. The `unique` and `not_null` tests of
+every column are checked with one query per test counting every failing row, like they used to
+be, with one query per test stopping at the first failing row, with the single query
+`BaseConnector.compile_tests_query` builds, which scans the table only once, and finally with that
+query on a sample of `--sample-size` rows as `doc --sample` does.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import sqlalchemy
+from sqlalchemy.pool import QueuePool
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dbt_sugar.core.connectors.base import BaseConnector  # noqa: E402
+
+TESTS = ["unique", "not_null"]
+
+
+class _SqliteConnector(BaseConnector):
+    def __init__(self, database_path: Path) -> None:
+        self.count_failures = False
+        self.sample_size = None
+        self.engine = sqlalchemy.create_engine(f"sqlite:///{database_path}", poolclass=QueuePool)
+
+
+def write_synthetic_table(connector: BaseConnector, rows: int, columns: int) -> None:
+    """Writes `main.model` where even columns are unique and odd columns hold a few nulls."""
+    column_names = [f"column_{column}" for column in range(columns)]
+    with connector.engine.begin() as connection:
+        connection.exec_driver_sql(f"create table model ({', '.join(column_names)})")
+        connection.exec_driver_sql(
+            f"insert into model with recursive numbers(n) as "
+            f"(select 1 union all select n + 1 from numbers where n < {rows}) select "
+            + ", ".join(
+                "n" if column % 2 == 0 else "case when n % 1000 = 0 then null else n % 97 end"
+                for column in range(columns)
+            )
+            + " from numbers"
+        )
+
+
+def _time_it(function: Callable[[], List[bool]]) -> Tuple[float, List[bool]]:
+    start = time.perf_counter()
+    results = function()
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    """Writes the synthetic table and times the ways of checking its tests."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--sample-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        connector = _SqliteConnector(Path(folder, "benchmark.db"))
+        write_synthetic_table(connector, args.rows, args.columns)
+        tests = [(f"column_{column}", test) for column in range(args.columns) for test in TESTS]
+
+        def one_query_per_test() -> List[bool]:
+            return [connector.run_test(test, "main", "model", column) for column, test in tests]
+
+        def single_query() -> List[bool]:
+            return [
+                not failures for failures in connector.count_tests_failures("main", "model", tests)
+            ]
+
+        print(f"Synthetic table: {args.rows} rows, {len(tests)} tests")
+        connector.count_failures = True
+        counting, counting_results = _time_it(one_query_per_test)
+        connector.count_failures = False
+        early_exit, early_exit_results = _time_it(one_query_per_test)
+        fused, fused_results = _time_it(single_query)
+        assert (
+            counting_results == early_exit_results == fused_results
+        ), "All the ways must agree on every test."
+        print(f"   one counting query per test: {counting:6.2f}s")
+        print(
+            f"one early exit query per test: {early_exit:6.2f}s "
+            f"({counting / early_exit:.1f}x faster)"
+        )
+        print(f"                  single query: {fused:6.2f}s ({counting / fused:.1f}x faster)")
+        connector.sample_size = args.sample_size
+        sampled, _ = _time_it(single_query)
+        print(f"        single query on sample: {sampled:6.2f}s ({counting / sampled:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Compares the peak memory needed to read a large manifest.json with json.load and streaming.
+
+Usage:
+    python benchmarks/manifest_memory.py --models 20000 --sql-size 8000
+
+A synthetic manifest is written to a temporary folder and each reader runs in its own process so
+that the peak RSS it reports only accounts for that reader.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
+# ru_maxrss is in kilobytes on Linux but in bytes on macOS.
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def write_synthetic_manifest(path: Path, models: int, sql_size: int, columns: int) -> None:
+    """Writes a manifest shaped like dbt's with one unique test per model column."""
+    padding = "select * from some_table where value = 'x' -- padding\n" * (sql_size // 54 + 1)
+    with open(path, "w") as stream:
+        stream.write('{"metadata": {"dbt_version": "0.20.0"}, "nodes": {')
+        for model_number in range(models):
+            model_name = f"model_{model_number}"
+            model_id = f"model.benchmark.{model_name}"
+            model = {
+                "raw_sql": padding[:sql_size],
+                "compiled_sql": padding[:sql_size],
+                "resource_type": "model",
+                "package_name": "benchmark",
+                "name": model_name,
+                "original_file_path": f"models/{model_name}.sql",
+                "patch_path": "benchmark://models/schema.yml",
+                "description": f"Description of {model_name}",
+                "columns": {
+                    f"column_{column}": {"name": f"column_{column}", "description": "A column"}
+                    for column in range(columns)
+                },
+                "config": {"materialized": "table", "tags": [], "meta": {}},
+            }
+            test = {
+                "raw_sql": "{{ test_unique(**_dbt_schema_test_kwargs) }}",
+                "compiled_sql": padding[: sql_size // 4],
+                "resource_type": "test",
+                "package_name": "benchmark",
+                "name": f"unique_{model_name}_column_0",
+                "column_name": "column_0",
+                "test_metadata": {"name": "unique", "kwargs": {"column_name": "column_0"}},
+                "depends_on": {"nodes": [model_id], "macros": ["macro.dbt.test_unique"]},
+            }
+            separator = "," if model_number else ""
+            stream.write(f"{separator}{json.dumps(model_id)}: {json.dumps(model)}")
+            stream.write(f", {json.dumps('test.benchmark.' + test['name'])}: {json.dumps(test)}")
+        stream.write('}, "sources": {}, "macros": {}, "docs": {}}')
+
+
+def read_manifest(path: Path, reader: str) -> None:
+    """Reads the manifest with the given reader and prints its statistics as JSON."""
+    start = time.perf_counter()
+    if reader == "json":
+        with open(path) as stream:
+            manifest = json.load(stream)
+        columns = sum(
+            len(node.get("columns", {}))
+            for node in manifest["nodes"].values()
+            if node["resource_type"] in ("model", "test")
+        )
+    else:
+        from dbt_sugar.core.clients.manifest import DbtManifest
+
+        columns = sum(len(node.get("columns", {})) for _, node in DbtManifest(path).iter_nodes())
+    print(
+        json.dumps(
+            {
+                "reader": reader,
+                "seconds": round(time.perf_counter() - start, 2),
+                "peak_rss_mb": round(
+                    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT / 2**20, 1
+                ),
+                "columns": columns,
+            }
+        )
+    )
+
+
+def main() -> None:
+    """Runs the benchmark or, when called with --read, a single reader."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=20000)
+    parser.add_argument("--sql-size", type=int, default=8000, help="Characters of SQL per model.")
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--read", choices=["json", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--manifest", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.read:
+        read_manifest(args.manifest, args.read)
+        return
+
+    with tempfile.TemporaryDirectory() as folder:
+        manifest_path = Path(folder, "manifest.json")
+        write_synthetic_manifest(manifest_path, args.models, args.sql_size, args.columns)
+        size_mb = manifest_path.stat().st_size / 2**20
+        print(f"Synthetic manifest: {args.models} models, {size_mb:.0f} MB")
+        for reader in ("stream", "json"):
+            result = subprocess.run(
+                [sys.executable, __file__, "--read", reader, "--manifest", str(manifest_path)],
+                check=True,
+                env=dict(os.environ, PYTHONPATH=str(REPOSITORY_ROOT)),
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+            )
+            stats = json.loads(result.stdout)
+            print(
+                f"{reader:>6}: {stats['seconds']:>6}s, peak RSS {stats['peak_rss_mb']:>7} MB, "
+                f"{stats['columns']} columns"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Measures how long building the descriptions dictionary of a large project takes on a warm start.
+
+Usage:
+    python benchmarks/project_snapshot.py --models 10000 --columns 25
+
+A synthetic dbt project is written to a temporary folder and the dictionary is built three ways:
+parsing every schema file, merging the contents served by the schema index and loading the
+project snapshot left by the previous run.
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dbt_sugar.core.project.schema_index import CACHE_FOLDER  # noqa: E402
+from dbt_sugar.core.project.snapshot import SNAPSHOT_FILENAME  # noqa: E402
+from dbt_sugar.core.task.base import BaseTask  # noqa: E402
+
+MODELS_PER_FILE = 10
+TESTS = ["unique", "not_null"]
+
+
+class _SugarConfig:
+    dbt_project_info = {"excluded_folders": [], "excluded_models": []}
+
+
+class _Flags:
+    lazy = False
+    jobs = 1
+
+    def __init__(self, use_cache: bool) -> None:
+        self.use_cache = use_cache
+
+
+class _Task(BaseTask):
+    def run(self) -> int:
+        return 0
+
+
+def _write_project(project_path: Path, models: int, columns: int, distinct_columns: int) -> None:
+    (project_path / "dbt_project.yml").write_text("name: benchmark\n")
+    models_path = project_path / "models"
+    models_path.mkdir()
+    for file_number in range(0, models, MODELS_PER_FILE):
+        lines = ["version: 2", "models:"]
+        for model_number in range(file_number, min(file_number + MODELS_PER_FILE, models)):
+            lines += [f"  - name: model_{model_number}", "    columns:"]
+            for column in range(columns):
+                column_number = (model_number * 7 + column) % distinct_columns
+                lines += [
+                    f"      - name: column_{column_number}",
+                    f"        description: Description of the column number {column_number}.",
+                    f"        tests: [{TESTS[column_number % len(TESTS)]}]",
+                ]
+        (models_path / f"schema_{file_number}.yml").write_text("\n".join(lines) + "\n")
+
+
+def _time(build: Callable[[], None], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Builds the dictionary of the same synthetic project in each way and prints the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=25, help="Columns per model.")
+    parser.add_argument("--distinct-columns", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    project_path = Path(tempfile.mkdtemp())
+    try:
+        _write_project(project_path, args.models, args.columns, args.distinct_columns)
+        snapshot_path = project_path / CACHE_FOLDER / SNAPSHOT_FILENAME
+
+        def build_from_schema_index() -> None:
+            if snapshot_path.exists():
+                snapshot_path.unlink()
+            _Task(_Flags(use_cache=True), project_path, _SugarConfig())  # type: ignore
+
+        cold = _time(
+            lambda: _Task(_Flags(use_cache=False), project_path, _SugarConfig()), 1  # type: ignore
+        )
+        schema_index = _time(build_from_schema_index, args.repeat)
+        snapshot = _time(
+            lambda: _Task(_Flags(use_cache=True), project_path, _SugarConfig()),  # type: ignore
+            args.repeat,
+        )
+    finally:
+        shutil.rmtree(project_path)
+
+    print(f"Synthetic project: {args.models} models of {args.columns} columns")
+    print(f"   parsing every file: {cold:6.2f}s")
+    print(f"   from schema index:  {schema_index:6.2f}s")
+    print(f"   from snapshot:      {snapshot:6.2f}s ({snapshot / schema_index:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measures how much the raw bytes prefilter speeds up description propagation.
+
+Usage:
+    python benchmarks/propagation_prefilter.py --files 2000 --models-per-file 5 --columns 20
+
+A synthetic project is written to a temporary folder where only a few schema files declare the
+updated columns. Propagation without any index is timed with every file parsed, like it used to
+be, and with files first screened by `RawTextPrefilter`.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dbt_sugar.core.task.base import BaseTask  # noqa: E402
+
+UPDATED_COLUMNS = ["rare_column_a", "rare_column_b"]
+
+
+class _SugarConfig:
+    dbt_project_info = {"excluded_folders": [], "excluded_models": []}
+
+
+class _Flags:
+    lazy = True
+    use_cache = False
+
+
+class _Task(BaseTask):
+    def run(self) -> int:
+        return 0
+
+
+def write_synthetic_project(
+    path: Path, files: int, models_per_file: int, columns: int, files_with_updates: int
+) -> None:
+    """Writes schema files, the first `files_with_updates` of them declaring the updated columns."""
+    for file_number in range(files):
+        lines = ["version: 2", "models:"]
+        for model_number in range(models_per_file):
+            lines += [f"  - name: model_{file_number}_{model_number}", "    columns:"]
+            column_names = [f"column_{column}" for column in range(columns)]
+            if file_number < files_with_updates and model_number == 0:
+                column_names += UPDATED_COLUMNS
+            for column_name in column_names:
+                lines += [
+                    f"      - name: {column_name}",
+                    f"        description: Description of {column_name} in this model.",
+                    "        tests:",
+                    "          - not_null",
+                ]
+        folder = path / "models" / f"folder_{file_number % 50}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"schema_{file_number}.yml").write_text("\n".join(lines) + "\n")
+
+
+def _time_it(function: Callable[[], List[Path]]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Writes the synthetic project and times both ways of finding the files to update."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--models-per-file", type=int, default=5)
+    parser.add_argument("--columns", type=int, default=20, help="Columns per model.")
+    parser.add_argument("--files-with-updates", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        project_path = Path(folder)
+        write_synthetic_project(
+            project_path, args.files, args.models_per_file, args.columns, args.files_with_updates
+        )
+        task = _Task(_Flags(), project_path, _SugarConfig())  # type: ignore
+        schema_files = task.project_inventory.schema_files
+        updates = {column: {"description": "An updated description."} for column in UPDATED_COLUMNS}
+
+        def parse_every_file() -> List[Path]:
+            return [
+                path
+                for path in schema_files
+                if task.update_column_description_from_schema(path, {})
+            ]
+
+        def prefilter_then_parse() -> List[Path]:
+            return [
+                path
+                for path in task.get_schema_files_with_columns(updates)
+                if task.update_column_description_from_schema(path, {})
+            ]
+
+        print(f"Synthetic project: {len(schema_files)} schema files")
+        every_file = _time_it(parse_every_file)
+        prefiltered = _time_it(prefilter_then_parse)
+        print(f"   parse every file: {every_file:6.2f}s")
+        print(f"prefilter and parse: {prefiltered:6.2f}s ({every_file / prefiltered:.0f}x faster)")
+        print(
+            f"files parsed after the prefilter: {len(task.get_schema_files_with_columns(updates))}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compares extracting the summary of a schema file from parse events with loading it whole.
+
+Usage:
+    python benchmarks/schema_extractor.py --models 1000 --columns 20
+
+The synthetic schema file carries what real ones do besides columns: model configs, meta blocks
+and tests with arguments. Time and peak memory (tracemalloc) are reported for both ways of
+getting the summary the schema index stores.
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dbt_sugar.core.clients.yaml_helpers import clear_yaml_cache, open_yaml  # noqa: E402
+from dbt_sugar.core.project.schema_extractor import extract_schema_summary  # noqa: E402
+from dbt_sugar.core.project.schema_index import (  # noqa: E402
+    COLUMN_KEYS_TO_INDEX,
+    summarise_schema_content,
+)
+
+
+def build_schema_content(models: int, columns: int) -> str:
+    """Writes a schema file with configs, meta blocks and tests with arguments."""
+    lines = ["version: 2", "", "models:"]
+    for model_number in range(models):
+        lines += [
+            f"  - name: model_{model_number}",
+            f"    description: Model {model_number} of the project.",
+            "    config:",
+            "      materialized: incremental",
+            "      unique_key: id",
+            "      tags: [finance, daily]",
+            "    meta:",
+            "      owner: data-team@example.com",
+            "      contains_pii: false",
+            "      sla: {hours: 24, alert_channel: data-alerts}",
+            "    columns:",
+        ]
+        for column_number in range(columns):
+            lines += [
+                f"      - name: column_{column_number}",
+                f"        description: Column {column_number} of model {model_number}.",
+                "        meta: {dimension: {type: string, label: A label}}",
+                "        tests:",
+                "          - not_null",
+                "          - accepted_values:",
+                "              values: [placed, shipped, completed, returned]",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def measure(function: Callable[[], Dict[str, Any]]) -> str:
+    """Times a function, then runs it again under tracemalloc which would skew the timing."""
+    clear_yaml_cache()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    clear_yaml_cache()
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return f"{elapsed:6.2f}s, peak {peak / 2 ** 20:6.1f}MB"
+
+
+def main() -> None:
+    """Measures both ways of summarising the synthetic schema file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        schema_file = Path(folder, "schema.yml")
+        schema_file.write_text(build_schema_content(args.models, args.columns))
+        print(f"Schema file: {schema_file.stat().st_size / 2 ** 20:.1f}MB")
+
+        def extract() -> Dict[str, Any]:
+            with open(schema_file, "r") as stream:
+                return extract_schema_summary(stream, COLUMN_KEYS_TO_INDEX)
+
+        print(f"full load: {measure(lambda: summarise_schema_content(open_yaml(schema_file)))}")
+        print(f"  extract: {measure(extract)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compares the parse and dump throughput of the YAML backends available on this install.
+
+Usage:
+    python benchmarks/yaml_backends.py --models 500 --columns 20
+
+Each backend parses and dumps the same synthetic schema file, shaped like the ones of a dbt
+project. Backends which aren't installed are reported as such.
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from yaml_writer import build_schema_content  # noqa: E402
+
+from dbt_sugar.core.clients.yaml_backends import YAML_BACKENDS, get_yaml_backend  # noqa: E402
+
+
+def main() -> None:
+    """Times each available backend on the same schema file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    content = build_schema_content(args.models, args.columns)
+    size_mb = len(content.encode("utf-8")) / 2**20
+    print(f"Schema file: {size_mb:.1f}MB, selected backend: {get_yaml_backend().name}")
+    for backend_class in YAML_BACKENDS:
+        if not backend_class.is_available():
+            print(f"{backend_class.name:>16}: not installed")
+            continue
+        backend = backend_class()
+        start = time.perf_counter()
+        data = backend.load(io.StringIO(content))
+        parse_time = time.perf_counter() - start
+        start = time.perf_counter()
+        dumped_content = backend.dump(data)
+        dump_time = time.perf_counter() - start
+        print(
+            f"{backend.name:>16}: parse {size_mb / parse_time:5.2f}MB/s, "
+            f"dump {len(dumped_content.encode('utf-8')) / 2 ** 20 / dump_time:5.2f}MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
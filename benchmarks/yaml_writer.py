@@ -0,0 +1,76 @@
+"""Compares dumping a whole schema file with patching the nodes which changed.
+
+Usage:
+    python benchmarks/yaml_writer.py --models 2000 --columns 20
+
+A large hand written schema file, with comments and long descriptions, gets one column
+description changed. Both writers are timed and the number of lines they change is reported.
+"""
+import argparse
+import difflib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dbt_sugar.core.clients.yaml_backends import get_yaml_backend  # noqa: E402
+from dbt_sugar.core.clients.yaml_helpers import open_yaml  # noqa: E402
+from dbt_sugar.core.clients.yaml_patch import patch_yaml  # noqa: E402
+
+
+def build_schema_content(models: int, columns: int) -> str:
+    """Writes a schema file the way people write them by hand."""
+    lines = ["version: 2", "", "models:"]
+    for model_number in range(models):
+        lines += [
+            f"  # model number {model_number}",
+            f"  - name: model_{model_number}",
+            f"    description: Model {model_number} gathers every order placed by the customers "
+            "of the shop, including the cancelled ones.",
+            "    columns:",
+        ]
+        for column_number in range(columns):
+            lines += [
+                f"      - name: column_{column_number}",
+                f"        description: Column {column_number} of the model.",
+                "        tests: [not_null]",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Times both writers on the same edit."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    content = build_schema_content(args.models, args.columns)
+    schema_file = Path(__file__).resolve().parent / "yaml_writer_schema.yml"
+    schema_file.write_text(content)
+    try:
+        data = open_yaml(schema_file)
+    finally:
+        schema_file.unlink()
+    data["models"][args.models // 2]["columns"][0]["description"] = "An updated description."
+    print(f"Schema file: {len(content) / 2 ** 20:.1f}MB, {content.count(chr(10))} lines")
+
+    for writer_name, writer in (
+        ("dump", get_yaml_backend().dump),
+        ("patch", lambda data: patch_yaml(content, data)),
+    ):
+        start = time.perf_counter()
+        written_content = writer(data)
+        elapsed = time.perf_counter() - start
+        changed_lines = sum(
+            line.startswith(("+", "-")) and not line.startswith(("+++", "---"))
+            for line in difflib.unified_diff(
+                content.splitlines(), written_content.splitlines(), lineterm="", n=0
+            )
+        )
+        print(f"{writer_name:>5}: {elapsed:6.2f}s, {changed_lines} lines changed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""Reads the artifacts dbt writes in its target folder, mainly the manifest.json.
+
+Manifests of big projects weigh hundreds of megabytes, most of it being compiled SQL, macros and
+docs that dbt-sugar never looks at. Loading them with `json.load` would need several times their
+size in memory so instead we stream through the file and only materialise the node fields we need.
+"""
+import json
+import re
+from json.decoder import scanstring  # type: ignore
+from pathlib import Path
+from typing import IO, Any, Collection, Dict, Iterator, Optional, Tuple
+
+DEFAULT_MANIFEST_PATH = Path("target", "manifest.json")
+NODE_RESOURCE_TYPES = ("model", "test")
+# the only node fields dbt-sugar ever reads, everything else is skipped without being decoded.
+NODE_FIELDS = (
+    "resource_type",
+    "package_name",
+    "name",
+    "description",
+    "original_file_path",
+    "patch_path",
+    "columns",
+    "tags",
+    "test_metadata",
+    "column_name",
+    "depends_on",
+    "attached_node",
+)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL_CHARACTER = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL_CHARACTER = re.compile(r'["\\]')
+# the rest of a string after its opening quote, escaped characters included.
+_STRING_END = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(r"[^,:}\]\s]+")
+
+
+class ManifestParsingError(ValueError):
+    """Thrown when the manifest is not the JSON document we expect."""
+
+
+class JsonStreamReader:
+    """Minimal pull parser walking a JSON document held in a file without loading all of it.
+
+    Only the values asked for with `read_value` are decoded (with the C accelerated json decoder),
+    everything else is skipped by scanning for structural characters. At any time the buffer only
+    holds one chunk of the file plus the value being decoded.
+    """
+
+    def __init__(self, stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Constructor for JsonStreamReader.
+
+        Args:
+            stream (IO[str]): Text stream to read the JSON document from.
+            chunk_size (int, optional): Number of characters read from the stream at once.
+        """
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+        self._decoder = json.JSONDecoder()
+
+    def _read_more(self, minimum_size: int = 0) -> bool:
+        """Drops what was consumed from the buffer and appends at least one chunk from the stream."""
+        if self._is_exhausted:
+            return False
+        consumed_size = self._position
+        self._buffer = self._buffer[consumed_size:]
+        self._position = 0
+        chunks = []
+        read_size = 0
+        while read_size < max(minimum_size, 1):
+            chunk = self._stream.read(max(self._chunk_size, minimum_size))
+            if not chunk:
+                self._is_exhausted = True
+                break
+            chunks.append(chunk)
+            read_size += len(chunk)
+        self._buffer += "".join(chunks)
+        return read_size > 0
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore
+            if self._position < len(self._buffer) or not self._read_more():
+                return
+
+    def peek(self) -> str:
+        """Returns the next non whitespace character without consuming it ('' at the end)."""
+        self._skip_whitespace()
+        start = self._position
+        end = start + 1
+        return self._buffer[start:end]
+
+    def expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise ManifestParsingError(
+                f"Expected '{character}' but found '{self.peek()}' in the manifest."
+            )
+        self._position += 1
+
+    def read_string(self) -> str:
+        self.expect('"')
+        while True:
+            try:
+                value, end = scanstring(self._buffer, self._position)
+            except ValueError:
+                # the string is cut by the end of the buffer.
+                self._position -= 1
+                if not self._read_more(len(self._buffer)):
+                    raise ManifestParsingError("The manifest ends in the middle of a string.")
+                self._position += 1
+                continue
+            self._position = end
+            return value
+
+    def read_value(self) -> Any:
+        """Decodes the next JSON value."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except ValueError:
+                # the value is cut by the end of the buffer, double what we hold and retry.
+                if not self._read_more(len(self._buffer)):
+                    raise
+                continue
+            # a number at the very end of the buffer might be cut.
+            if end == len(self._buffer) and self._read_more():
+                continue
+            self._position = end
+            return value
+
+    def skip_value(self) -> None:
+        """Moves past the next JSON value without decoding it."""
+        first_character = self.peek()
+        if first_character == '"':
+            self._skip_string()
+        elif first_character in ("{", "["):
+            self._skip_container()
+        else:
+            while True:
+                match = _SCALAR.match(self._buffer, self._position)
+                if match and match.end() == len(self._buffer) and self._read_more():
+                    continue
+                if not match:
+                    raise ManifestParsingError("Unexpected end of the manifest.")
+                self._position = match.end()
+                return
+
+    def _skip_string(self) -> None:
+        # we sit on the opening quote.
+        self._position += 1
+        match = _STRING_END.match(self._buffer, self._position)
+        if match:
+            self._position = match.end()
+            return
+        # the string is cut by the end of the buffer, scan it chunk by chunk.
+        while True:
+            match = _STRING_SPECIAL_CHARACTER.search(self._buffer, self._position)
+            if not match or match.start() + 1 >= len(self._buffer):
+                # keep the last character around in case it is an escaping backslash.
+                self._position = max(self._position, len(self._buffer) - 1)
+                if not self._read_more():
+                    raise ManifestParsingError("The manifest ends in the middle of a string.")
+                continue
+            if match.group() == "\\":
+                self._position = match.start() + 2
+                continue
+            self._position = match.end()
+            return
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            match = _STRUCTURAL_CHARACTER.search(self._buffer, self._position)
+            if not match:
+                self._position = len(self._buffer)
+                if not self._read_more():
+                    raise ManifestParsingError("The manifest ends in the middle of an object.")
+                continue
+            character = match.group()
+            if character == '"':
+                self._position = match.start()
+                self._skip_string()
+                continue
+            self._position = match.end()
+            depth += 1 if character in ("{", "[") else -1
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """Yields the keys of the next JSON object, the caller must read or skip each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self._position += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ManifestParsingError(f"Unexpected '{separator}' in the manifest.")
+
+
+class DbtManifest:
+    """Gives access to the nodes of a dbt manifest.json with a bounded memory footprint."""
+
+    def __init__(self, manifest_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Constructor for DbtManifest.
+
+        Args:
+            manifest_path (Path): Full path to the manifest.json.
+            chunk_size (int, optional): Number of characters read from the manifest at once.
+        """
+        self.manifest_path = Path(manifest_path)
+        self._chunk_size = chunk_size
+
+    def exists(self) -> bool:
+        return self.manifest_path.is_file()
+
+    @property
+    def modification_time_ns(self) -> int:
+        return self.manifest_path.stat().st_mtime_ns
+
+    @staticmethod
+    def _read_node(reader: JsonStreamReader, fields: Collection[str]) -> Dict[str, Any]:
+        node = {}
+        for field in reader.iter_object():
+            if field in fields:
+                node[field] = reader.read_value()
+            else:
+                reader.skip_value()
+        return node
+
+    def iter_nodes(
+        self,
+        resource_types: Collection[str] = NODE_RESOURCE_TYPES,
+        fields: Collection[str] = NODE_FIELDS,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yields the unique id and the needed fields of the manifest nodes one at a time.
+
+        Args:
+            resource_types (Collection[str], optional): Types of the nodes to yield.
+                Defaults to models and tests.
+            fields (Collection[str], optional): Node fields to materialise. Defaults to NODE_FIELDS.
+        """
+        # resource_type is needed to filter the nodes even when it's not asked for.
+        fields = set(fields) | {"resource_type"}
+        with open(self.manifest_path, "r", encoding="utf-8") as stream:
+            reader = JsonStreamReader(stream, chunk_size=self._chunk_size)
+            for key in reader.iter_object():
+                if key != "nodes":
+                    reader.skip_value()
+                    continue
+                for unique_id in reader.iter_object():
+                    node = self._read_node(reader, fields)
+                    if node.get("resource_type") in resource_types:
+                        yield unique_id, node
+                return
+
+    def read_top_level_value(self, key: str) -> Optional[Any]:
+        """Decodes a single top level entry of the manifest such as `metadata` or `child_map`."""
+        with open(self.manifest_path, "r", encoding="utf-8") as stream:
+            reader = JsonStreamReader(stream, chunk_size=self._chunk_size)
+            for manifest_key in reader.iter_object():
+                if manifest_key == key:
+                    return reader.read_value()
+                reader.skip_value()
+        return None
@@ -0,0 +1,97 @@
+"""Backends parsing and serialising YAML, dbt-sugar picks the fastest one available."""
+import collections
+import functools
+import importlib.util
+from typing import IO, Any, Dict, Tuple, Type
+
+import yaml
+import yamlloader
+
+from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+
+
+class YamlBackend:
+    """Parses and serialises YAML, mappings keep the order of their keys.
+
+    Dumps always go through PyYAML's emitter, in C when it has been built with libyaml, so that
+    files are written byte for byte the same whatever backend parsed them.
+    """
+
+    name = "pure Python"
+    loader: Type = yamlloader.ordereddict.SafeLoader
+    dumper: Type = yamlloader.ordereddict.Dumper
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    def load(self, stream: IO[str]) -> Any:
+        return yaml.load(stream, Loader=self.loader)
+
+    def dump(self, data: Any) -> str:
+        if isinstance(data, dict):
+            data = collections.OrderedDict(data)
+        return yaml.dump(data, width=100, Dumper=self.dumper)
+
+
+class LibYamlBackend(YamlBackend):
+    """PyYAML's bindings to libyaml."""
+
+    name = "libyaml"
+    loader = yamlloader.ordereddict.CSafeLoader
+    dumper = yamlloader.ordereddict.CDumper
+
+    @staticmethod
+    def is_available() -> bool:
+        # yamlloader aliases the C classes to the pure Python ones when libyaml is missing.
+        return bool(getattr(yaml, "__with_libyaml__", False))
+
+
+class RuamelYamlBackend(YamlBackend):
+    """ruamel.yaml's C parser, for installs where PyYAML was built without libyaml."""
+
+    name = "ruamel.yaml (C)"
+
+    def __init__(self) -> None:
+        from ruamel.yaml import YAML
+        from ruamel.yaml.constructor import SafeConstructor
+
+        class OrderedSafeConstructor(SafeConstructor):
+            def construct_ordered_map(self, node):  # type: ignore
+                data: Dict[Any, Any] = collections.OrderedDict()
+                yield data
+                data.update(self.construct_mapping(node))
+
+        OrderedSafeConstructor.add_constructor(
+            "tag:yaml.org,2002:map", OrderedSafeConstructor.construct_ordered_map
+        )
+        self._yaml = YAML(typ="safe", pure=False)
+        self._yaml.Constructor = OrderedSafeConstructor
+        # ruamel defaults to YAML 1.2, values like `yes` or `1:30` must load like PyYAML's 1.1.
+        self._yaml.version = (1, 1)
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            return (
+                importlib.util.find_spec("ruamel.yaml") is not None
+                and importlib.util.find_spec("_ruamel_yaml") is not None
+            )
+        except ImportError:
+            return False
+
+    def load(self, stream: IO[str]) -> Any:
+        return self._yaml.load(stream)
+
+
+# fastest first, the pure Python backend is always available.
+YAML_BACKENDS: Tuple[Type[YamlBackend], ...] = (LibYamlBackend, RuamelYamlBackend, YamlBackend)
+
+
+@functools.lru_cache(maxsize=None)
+def get_yaml_backend() -> YamlBackend:
+    """Returns the fastest YAML backend available on this install, picked on the first call."""
+    backend_class = next(backend for backend in YAML_BACKENDS if backend.is_available())
+    yaml_backend = backend_class()
+    logger.debug(f"Using the {yaml_backend.name} YAML backend.")
+    return yaml_backend
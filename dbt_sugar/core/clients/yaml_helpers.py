@@ -1,18 +1,82 @@
 """Contains yaml related utils which might get used in places."""
 
 import collections
+import os
+import pickle
 from pathlib import Path
-from typing import Any, Dict
-
-import yaml
-import yamlloader
+from typing import Any, Dict, Optional, Tuple
 
+from dbt_sugar.core.clients.yaml_backends import (  # noqa: F401
+    YAML_BACKENDS,
+    LibYamlBackend,
+    RuamelYamlBackend,
+    YamlBackend,
+    get_yaml_backend,
+)
+from dbt_sugar.core.clients.yaml_patch import patch_yaml
 from dbt_sugar.core.exceptions import YAMLFileEmptyError
+from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+
+# the cache holds at most that many bytes of pickled content, least recently used files go first.
+YAML_CACHE_MAX_BYTES = 64 * 2 ** 20
+
+
+class _ParsedYamlCache:
+    """Parsed content of the yaml files opened during a run.
+
+    Content is kept pickled: unpickling is much faster than parsing again, hands each caller its
+    own copy to modify and takes less memory than the parsed objects. Entries are only used while
+    the file keeps the modification time and size it had when it was parsed.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "collections.OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = (
+            collections.OrderedDict()
+        )
+        self._size = 0
+
+    def get(self, key: str, fingerprint: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != fingerprint:
+            return None
+        self._entries.move_to_end(key)
+        return pickle.loads(entry[1])
+
+    def put(self, key: str, fingerprint: Tuple[int, int], content: Dict[str, Any]) -> None:
+        self.invalidate(key)
+        pickled_content = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(pickled_content) > self.max_bytes:
+            return
+        self._entries[key] = (fingerprint, pickled_content)
+        self._size += len(pickled_content)
+        while self._size > self.max_bytes:
+            _, (_, evicted_content) = self._entries.popitem(last=False)
+            self._size -= len(evicted_content)
+
+    def invalidate(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+_parsed_yaml_cache = _ParsedYamlCache(YAML_CACHE_MAX_BYTES)
+
+
+def clear_yaml_cache() -> None:
+    """Forgets every parsed file, tasks call it when they start so that the cache is run-scoped."""
+    _parsed_yaml_cache.clear()
 
 
 def open_yaml(path: Path) -> Dict[str, Any]:
     """Opens a yaml file... Nothing too exciting there.
 
+    A file is only parsed once per run unless it changes, later calls get a copy of its content.
+
     Args:
         path (Path): Full filename path pointing to the yaml file we want to open.
 
@@ -20,21 +84,50 @@ def open_yaml(path: Path) -> Dict[str, Any]:
         Dict[str, Any]: A python dict containing the content from the yaml file.
     """
     if path.is_file():
+        stat = path.stat()
+        cache_key = os.path.abspath(path)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        yaml_dict = _parsed_yaml_cache.get(cache_key, fingerprint)
+        if yaml_dict is not None:
+            return yaml_dict
         with open(path, "r") as stream:
-            yaml_dict = yaml.load(stream, Loader=yamlloader.ordereddict.CSafeLoader)
+            yaml_dict = get_yaml_backend().load(stream)
             if yaml_dict:
+                _parsed_yaml_cache.put(cache_key, fingerprint, yaml_dict)
                 return yaml_dict
             raise YAMLFileEmptyError(f"The following file {path.resolve()} seems empty.")
     raise FileNotFoundError(f"File {path.resolve()} was not found.")
 
 
-def save_yaml(path: Path, data: Dict[str, Any]) -> None:
+def save_yaml(path: Path, data: Dict[str, Any]) -> bool:
     """Saves a YAML content.
 
+    An existing file is patched rather than dumped again so that its comments, formatting and
+    untouched entries stay as they are, both through the YAML backend picked for this install.
+    It is left untouched, mtime included, when it already holds exactly that content.
+
     Args:
         path (Path): Full filename path pointing to the yaml file we want to save.
         data (dict[str, Any]): Data to save in the file.
+
+    Returns:
+        bool: True when the file was written.
     """
-    with open(path, "w") as outfile:
-        data_order_dict = collections.OrderedDict(data)
-        yaml.dump(data_order_dict, outfile, width=100, Dumper=yamlloader.ordereddict.CDumper)
+    path = Path(path)
+    yaml_backend = get_yaml_backend()
+    serialized_data = None
+    if path.is_file():
+        with open(path, "r", newline="") as stream:
+            original_content = stream.read()
+        serialized_data = patch_yaml(original_content, data, yaml_backend)
+        if serialized_data is None:
+            logger.debug(f"{path} could not be patched, it is dumped whole.")
+            serialized_data = yaml_backend.dump(data)
+        if serialized_data == original_content:
+            return False
+    else:
+        serialized_data = yaml_backend.dump(data)
+    _parsed_yaml_cache.invalidate(os.path.abspath(path))
+    with open(path, "w", newline="") as outfile:
+        outfile.write(serialized_data)
+    return True
@@ -0,0 +1,348 @@
+"""Applies changes to a YAML document by editing its text instead of dumping it again.
+
+Dumping a schema file again drops its comments, reflows its long strings and reorders its keys,
+which turns a one column edit into a diff of the whole file. The document is composed instead so
+that each node knows where it sits in the text, the new content is compared with it node by node
+and only the nodes which changed are rewritten:
+    - changed scalars are replaced where they stand,
+    - new mapping keys are inserted next to their neighbours,
+    - new sequence items are appended after the last item,
+    - anything else (removed keys, reordered items...) re-renders the smallest node holding it.
+
+Whatever isn't changed is left byte for byte as it was.
+"""
+import collections
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import yaml
+import yamlloader
+
+from dbt_sugar.core.clients.yaml_backends import YamlBackend, get_yaml_backend
+
+_INDENT = 2
+# widest line the emitters accept, scalars are written on one line whatever their length.
+_NO_LINE_WRAPPING = 2**31 - 1
+# characters after which a scalar can start without a separating space.
+_SCALAR_SEPARATORS = " \t\r\n[{,"
+
+
+class UnpatchableDocumentError(Exception):
+    """Raised when a document can't be patched and has to be dumped whole."""
+
+
+class _IndentedSequenceDumper(yamlloader.ordereddict.Dumper):
+    """Dumper indenting the sequences nested in mappings, like most hand written schema files."""
+
+    def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:
+        return super().increase_indent(flow, False)
+
+
+def _dump_inline_scalar(value: Any, in_flow: bool, dumper: Type) -> str:
+    # a continuation line would need to know the indentation of the node it replaces.
+    style = '"' if isinstance(value, str) and ("\n" in value or "\r" in value) else None
+    if in_flow:
+        return yaml.dump(
+            [value],
+            default_flow_style=True,
+            default_style=style,
+            width=_NO_LINE_WRAPPING,
+            Dumper=dumper,
+        ).strip()[1:-1]
+    text = yaml.dump(value, default_style=style, width=_NO_LINE_WRAPPING, Dumper=dumper)
+    if text.endswith("\n...\n"):
+        text = text[: -len("\n...\n")]
+    return text.rstrip("\n")
+
+
+def _indent_lines(text: str, indentation: int) -> str:
+    """Indents all lines but the first one, which continues the line it is written on."""
+    lines = text.rstrip("\n").split("\n")
+    return "\n".join(
+        [lines[0]] + [" " * indentation + line if line else line for line in lines[1:]]
+    )
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (dict, list))
+
+
+class _DocumentPatcher:
+    def __init__(self, text: str, yaml_backend: YamlBackend) -> None:
+        self.text = text
+        self._yaml_backend = yaml_backend
+        self._loader = yaml_backend.loader(text)
+        self._visited_nodes: set = set()
+        self._indents_sequences = False
+        # whether nodes were added or rendered again rather than only scalars replaced in place.
+        self.has_structural_edits = False
+        # (start, end, replacement) of each edit, applied from the end of the text.
+        self._edits: List[Tuple[int, int, str]] = []
+
+    def patch(self, data: Any) -> str:
+        try:
+            root = self._loader.get_single_node()
+        except yaml.YAMLError as error:
+            raise UnpatchableDocumentError(f"The document can't be parsed: {error}") from error
+        finally:
+            self._loader.dispose()
+        if not isinstance(root, yaml.MappingNode) or root.flow_style or not isinstance(data, dict):
+            raise UnpatchableDocumentError("Only documents made of a block mapping are patched.")
+        self._indents_sequences = self._indents_sequences_in_mappings(root)
+        self._patch_node(root, data, indentation=0, is_sequence_item=False, in_flow=False)
+
+        text = self.text
+        for start, end, replacement in sorted(self._edits, reverse=True):
+            text = text[:start] + replacement + text[end:]
+        return text
+
+    @staticmethod
+    def _indents_sequences_in_mappings(root: yaml.Node) -> bool:
+        """Whether the sequences nested in mappings are indented under their key."""
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, yaml.MappingNode) and not node.flow_style:
+                for key_node, value_node in node.value:
+                    if isinstance(value_node, yaml.SequenceNode) and not value_node.flow_style:
+                        return value_node.start_mark.column > key_node.start_mark.column
+                    nodes.append(value_node)
+            elif isinstance(node, yaml.SequenceNode) and not node.flow_style:
+                nodes.extend(node.value)
+        return False
+
+    def _render_block(self, value: Any) -> str:
+        if not self._indents_sequences:
+            return self._yaml_backend.dump(value)
+        if isinstance(value, dict):
+            value = collections.OrderedDict(value)
+        return yaml.dump(value, width=100, Dumper=_IndentedSequenceDumper)
+
+    def _scalar_value(self, node: yaml.ScalarNode) -> Any:
+        # strings are most of a schema file, they are read off the node to skip the constructor.
+        if node.tag == "tag:yaml.org,2002:str":
+            return node.value
+        return self._loader.construct_object(node, deep=True)
+
+    def _name_of(self, node: yaml.MappingNode) -> Any:
+        for key_node, value_node in node.value:
+            if isinstance(key_node, yaml.ScalarNode) and isinstance(value_node, yaml.ScalarNode):
+                if self._scalar_value(key_node) == "name":
+                    return self._scalar_value(value_node)
+        return None
+
+    def _patch_node(
+        self, node: yaml.Node, value: Any, indentation: int, is_sequence_item: bool, in_flow: bool
+    ) -> None:
+        if id(node) in self._visited_nodes:
+            raise UnpatchableDocumentError("Documents using anchors and aliases are not patched.")
+        self._visited_nodes.add(id(node))
+
+        if isinstance(node, yaml.ScalarNode) and _is_scalar(value):
+            old_value = self._scalar_value(node)
+            if type(old_value) is not type(value) or old_value != value:
+                self._replace_node(node, value, indentation, is_sequence_item, in_flow)
+        elif isinstance(node, yaml.MappingNode) and isinstance(value, dict):
+            self._patch_mapping(node, value, indentation, is_sequence_item, in_flow)
+        elif isinstance(node, yaml.SequenceNode) and isinstance(value, list):
+            self._patch_sequence(node, value, indentation, is_sequence_item, in_flow)
+        else:
+            self._replace_node(node, value, indentation, is_sequence_item, in_flow)
+
+    def _patch_mapping(
+        self,
+        node: yaml.MappingNode,
+        value: Dict[Any, Any],
+        indentation: int,
+        is_sequence_item: bool,
+        in_flow: bool,
+    ) -> None:
+        key_nodes: Dict[Any, yaml.Node] = {}
+        value_nodes: Dict[Any, yaml.Node] = {}
+        for key_node, value_node in node.value:
+            if (
+                not isinstance(key_node, yaml.ScalarNode)
+                or key_node.tag == "tag:yaml.org,2002:merge"
+            ):
+                raise UnpatchableDocumentError("Complex and merge keys are not patched.")
+            key = self._scalar_value(key_node)
+            if key in key_nodes:
+                raise UnpatchableDocumentError(f"The key '{key}' is defined twice.")
+            key_nodes[key] = key_node
+            value_nodes[key] = value_node
+
+        # existing keys keep their place, key order does not change what a mapping holds.
+        new_keys = [key for key in value if key not in key_nodes]
+        if any(key not in value for key in key_nodes) or (
+            new_keys and (node.flow_style or in_flow)
+        ):
+            self._replace_node(node, value, indentation, is_sequence_item, in_flow)
+            return
+
+        child_indentation = node.start_mark.column if node.value else indentation
+        for key, value_node in value_nodes.items():
+            self._patch_node(
+                value_node,
+                value[key],
+                indentation=child_indentation + _INDENT,
+                is_sequence_item=False,
+                in_flow=in_flow or bool(node.flow_style),
+            )
+
+        keys = list(value)
+        for next_position, key in enumerate(keys, start=1):
+            if key in key_nodes:
+                continue
+            rendered_entry = _indent_lines(
+                self._render_block(collections.OrderedDict([(key, value[key])])), child_indentation
+            )
+            next_existing_key = next((k for k in keys[next_position:] if k in key_nodes), None)
+            if next_existing_key is not None:
+                # written right before the key which follows it, on that key's line.
+                insertion_point = key_nodes[next_existing_key].start_mark.index
+                replacement = rendered_entry + "\n" + " " * child_indentation
+            else:
+                insertion_point = self._line_end(self._content_end(node))
+                replacement = "\n" + " " * child_indentation + rendered_entry
+            self._add_edit(insertion_point, insertion_point, replacement)
+
+    def _patch_sequence(
+        self,
+        node: yaml.SequenceNode,
+        value: List[Any],
+        indentation: int,
+        is_sequence_item: bool,
+        in_flow: bool,
+    ) -> None:
+        old_items = node.value
+        if (
+            len(value) < len(old_items)
+            or (len(value) > len(old_items) and (not old_items or node.flow_style or in_flow))
+            or not self._are_same_items(old_items, value)
+        ):
+            self._replace_node(node, value, indentation, is_sequence_item, in_flow)
+            return
+
+        item_indentation = node.start_mark.column
+        for item_node, item in zip(old_items, value):
+            self._patch_node(
+                item_node,
+                item,
+                indentation=item_indentation + _INDENT,
+                is_sequence_item=not (node.flow_style or in_flow),
+                in_flow=in_flow or bool(node.flow_style),
+            )
+        old_length = len(old_items)
+        for item in value[old_length:]:
+            insertion_point = self._line_end(self._content_end(node))
+            rendered_item = _indent_lines(self._render_block([item]), item_indentation)
+            self._add_edit(
+                insertion_point, insertion_point, "\n" + " " * item_indentation + rendered_item
+            )
+
+    def _are_same_items(self, item_nodes: List[yaml.Node], items: List[Any]) -> bool:
+        """Checks that items were edited in place rather than inserted, removed or reordered.
+
+        Mappings are matched on their `name` like dbt models and columns, other items on their
+        value when they are scalars. Anything else is assumed to be edited in place.
+        """
+        for item_node, item in zip(item_nodes, items):
+            if isinstance(item_node, yaml.MappingNode) and isinstance(item, dict):
+                if self._name_of(item_node) != item.get("name"):
+                    return False
+            elif isinstance(item_node, yaml.ScalarNode) and _is_scalar(item):
+                if self._scalar_value(item_node) != item:
+                    return False
+            elif isinstance(item_node, yaml.ScalarNode) != _is_scalar(item):
+                return False
+        return True
+
+    def _replace_node(
+        self, node: yaml.Node, value: Any, indentation: int, is_sequence_item: bool, in_flow: bool
+    ) -> None:
+        start = node.start_mark.index
+        end = self._content_end(node)
+        is_collection_node = isinstance(node, yaml.CollectionNode)
+        is_flow_collection = isinstance(node, yaml.CollectionNode) and bool(node.flow_style)
+        if in_flow and _is_scalar(value):
+            replacement = _dump_inline_scalar(value, True, self._yaml_backend.dumper)
+        elif in_flow or (is_flow_collection and not _is_scalar(value)):
+            # flow collections stay on one line, in flow style.
+            replacement = yaml.dump(
+                value,
+                default_flow_style=True,
+                width=_NO_LINE_WRAPPING,
+                Dumper=self._yaml_backend.dumper,
+            ).strip()
+        elif _is_scalar(value) or (isinstance(value, (dict, list)) and not value):
+            replacement = _dump_inline_scalar(value, False, self._yaml_backend.dumper)
+        elif is_sequence_item or (is_collection_node and not is_flow_collection):
+            # block collections start on their own line, or after the dash of a sequence item.
+            replacement = _indent_lines(self._render_block(value), node.start_mark.column)
+            # a comment after the last item would end up describing another item.
+            end = self._line_end(end)
+        else:
+            replacement = (
+                "\n" + " " * indentation + _indent_lines(self._render_block(value), indentation)
+            )
+            # a value which moves to the next line must not leave spaces after its key.
+            while start > 0 and self.text[start - 1] in " \t":
+                start -= 1
+
+        if start > 0 and self.text[start - 1] not in _SCALAR_SEPARATORS and replacement[:1] != "\n":
+            replacement = " " + replacement
+        self._add_edit(
+            start, end, replacement, is_structural=is_collection_node or not _is_scalar(value)
+        )
+
+    def _add_edit(self, start: int, end: int, replacement: str, is_structural: bool = True) -> None:
+        self._edits.append((start, end, replacement))
+        self.has_structural_edits = self.has_structural_edits or is_structural
+
+    def _content_end(self, node: yaml.Node) -> int:
+        """Index right after the last character of a node, trailing blank lines excluded."""
+        if isinstance(node, yaml.MappingNode) and node.value and not node.flow_style:
+            return self._content_end(node.value[-1][1])
+        if isinstance(node, yaml.SequenceNode) and node.value and not node.flow_style:
+            return self._content_end(node.value[-1])
+        start, end = node.start_mark.index, node.end_mark.index
+        return start + len(self.text[start:end].rstrip())
+
+    def _line_end(self, index: int) -> int:
+        line_end = self.text.find("\n", index)
+        if line_end == -1:
+            return len(self.text)
+        if line_end > 0 and self.text[line_end - 1] == "\r":
+            return line_end - 1
+        return line_end
+
+
+def patch_yaml(text: str, data: Any, yaml_backend: Optional[YamlBackend] = None) -> Optional[str]:
+    """Edits the text of a YAML document so that it holds `data`.
+
+    Args:
+        text (str): Text of the YAML document.
+        data (Any): Content the document should hold.
+        yaml_backend (Optional[YamlBackend], optional): Backend whose PyYAML loader and dumper
+            compose the document and render the new nodes. Defaults to the fastest available.
+
+    Returns:
+        Optional[str]: The edited text, None when the document has to be dumped whole instead
+            because it can't be parsed or patched or because the patch would not load as `data`.
+    """
+    yaml_backend = yaml_backend or get_yaml_backend()
+    patcher = _DocumentPatcher(text, yaml_backend)
+    try:
+        patched_text = patcher.patch(data)
+    except UnpatchableDocumentError:
+        return None
+    if "\r\n" in text:
+        patched_text = patched_text.replace("\r\n", "\n").replace("\n", "\r\n")
+    # scalars written on one line by the emitter can't break the document, new nodes could.
+    if not patcher.has_structural_edits:
+        return patched_text
+    try:
+        if yaml.load(patched_text, Loader=yaml_backend.loader) != data:
+            return None
+    except yaml.YAMLError:
+        return None
+    return patched_text
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 
 from dbt_sugar.core.clients.yaml_helpers import open_yaml
 from dbt_sugar.core.exceptions import (
@@ -14,6 +14,10 @@ from dbt_sugar.core.exceptions import (
 )
 from dbt_sugar.core.flags import FlagParser
 from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+from dbt_sugar.core.project.column_index import CONFLICT_POLICIES, DEFAULT_CONFLICT_POLICY
+
+# rows tests are checked on when they run on a sample of the tables.
+DEFAULT_SAMPLE_SIZE = 100000
 
 
 class DbtProjectsModel(BaseModel):
@@ -23,6 +27,16 @@ class DbtProjectsModel(BaseModel):
     path: str
     excluded_folders: Optional[Union[List[str], str]] = []
     excluded_models: Optional[Union[List[str], str]] = []
+    description_conflict_policy: Optional[str] = DEFAULT_CONFLICT_POLICY
+    column_name_prefixes: Optional[List[str]] = []
+    column_name_suffixes: Optional[List[str]] = []
+
+    @validator("description_conflict_policy")
+    def check_description_conflict_policy(cls, value):
+        assert (
+            value in CONFLICT_POLICIES
+        ), f"'description_conflict_policy' must be one of {CONFLICT_POLICIES}."
+        return value
 
 
 class SyrupModel(BaseModel):
@@ -32,6 +46,13 @@ class SyrupModel(BaseModel):
     dbt_projects: List[DbtProjectsModel]
     always_enforce_tests: Optional[bool] = True
     always_add_tags: Optional[bool] = True
+    # not Optional so that an explicit null is rejected instead of reaching the connectors.
+    test_sample_size: int = DEFAULT_SAMPLE_SIZE
+
+    @validator("test_sample_size")
+    def check_test_sample_size(cls, value):
+        assert value > 0, "'test_sample_size' must be a positive number of rows."
+        return value
 
 
 class DefaultsModel(BaseModel):
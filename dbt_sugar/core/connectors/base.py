@@ -8,6 +8,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import sqlalchemy
 
+# SQLAlchemy's default, connectors keep at least that many connections open once used.
+DEFAULT_POOL_SIZE = 5
+
 
 class BaseConnector(ABC):
     """
@@ -19,6 +22,9 @@ class BaseConnector(ABC):
     def __init__(
         self,
         connection_params: Dict[str, str],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        count_failures: bool = False,
+        sample_size: Optional[int] = None,
     ) -> None:
         """
         Creates the URL and the Engine for future connections.
@@ -26,8 +32,16 @@ class BaseConnector(ABC):
         Args:
             connection_params (Dict[str, str]): Dict containing database connection
                 parameters and credentials.
+            pool_size (int, optional): Number of connections the engine keeps open for reuse,
+                it should be at least the number of threads running queries at once.
+            count_failures (bool, optional): When True tests count every failing row instead of
+                stopping at the first one.
+            sample_size (Optional[int], optional): When given tests only check about that many
+                rows of the tables instead of all of them.
         """
-        self.engine = sqlalchemy.create_engine(**connection_params)
+        self.count_failures = count_failures
+        self.sample_size = sample_size
+        self.engine = sqlalchemy.create_engine(**connection_params, pool_size=pool_size)
 
     def get_columns_from_table(
         self,
@@ -49,12 +63,58 @@ class BaseConnector(ABC):
         columns_names = [column["name"] for column in columns]
         return columns_names
 
+    def get_table_reference(self, schema: str, table: str) -> str:
+        """
+        Reference to a table in the FROM clause of test queries, sampled when asked to.
+
+        Sampling keeps the first rows of the table as not every database can pick random ones,
+        connectors override this with the sampling their database offers.
+
+        Args:
+            schema (str): Name of the schema in which the table lives.
+            table (str): Name of the table.
+        Returns:
+            str: Table reference.
+        """
+        if self.sample_size is None:
+            return f"{schema}.{table}"
+        return f"(select * from {schema}.{table} limit {self.sample_size}) as sampled_{table}"
+
+    def compile_test_query(self, test_name: str, schema: str, table: str, column: str) -> str:
+        """
+        Compiles a pre-defined test into the query selecting its failures.
+
+        Unless the connector counts failures, the query stops at the first failing row so that the
+        database doesn't have to go through the whole table to tell us a test fails.
+
+        Args:
+            test_name(str): Name of the test to run. (For now only "unique" and "not null" are supported).
+            schema (str): Name of the schema in which the table to be tested lives.
+            table (str): Name of the table to on which to run the test.
+            column (str): Name of the column on which to run the test.
+        Returns:
+            str: Query returning no row or a 0 when the test passes.
+        """
+        relation = self.get_table_reference(schema, table)
+        if self.count_failures:
+            TESTS = {
+                "unique": f"""select count(*) as errors from(
+                select {column} from {relation} where {column} is not null group by {column} having count(*) > 1 )
+                errors""",
+                "not_null": f"select count(*) as errors from {relation} where {column} is null",
+            }
+        else:
+            TESTS = {
+                "unique": f"select 1 as errors from {relation} where {column} is not null "
+                f"group by {column} having count(*) > 1 limit 1",
+                "not_null": f"select 1 as errors from {relation} where {column} is null limit 1",
+            }
+        return TESTS[test_name]
+
     def run_test(self, test_name: str, schema: str, table: str, column: str) -> bool:
         """
         Method to run pre-defined tests before we add them to the schema.yaml.
 
-        We defined the test dictionary and call the test that the user wants.
-
         Args:
             test_name(str): Name of the test to run. (For now only "unique" and "not null" are supported).
             schema (str): Name of the schema in which the table to be tested lives.
@@ -63,16 +123,90 @@ class BaseConnector(ABC):
         Returns:
             boolean: True if the test is passes, and False if it fails.
         """
-        TESTS = {
-            "unique": f"""select count(*) as errors from(
-                select {column} from {schema}.{table} where {column} is not null group by {column} having count(*) > 1 )
-                errors""",
-            "not_null": f"select count(*) as errors from {schema}.{table} where {column} is null",
-        }
-        query = TESTS[test_name]
+        query = self.compile_test_query(test_name, schema, table, column)
         result = self.execute_and_check(query)
         return result
 
+    def count_test_failures(self, test_name: str, schema: str, table: str, column: str) -> int:
+        """
+        Method to run a pre-defined test and get how many rows fail it.
+
+        Args:
+            test_name(str): Name of the test to run. (For now only "unique" and "not null" are supported).
+            schema (str): Name of the schema in which the table to be tested lives.
+            table (str): Name of the table to on which to run the test.
+            column (str): Name of the column on which to run the test.
+        Returns:
+            int: Number of failures, only 0 or 1 unless the connector counts failures.
+        """
+        return self.fetch_failures(self.compile_test_query(test_name, schema, table, column))
+
+    def count_if(self, condition: str) -> str:
+        """
+        SQL aggregate counting the rows of a table matching a condition.
+
+        Args:
+            condition (str): SQL boolean expression.
+        Returns:
+            str: Aggregate expression, portable unless a connector knows of a better one.
+        """
+        return f"sum(case when {condition} then 1 else 0 end)"
+
+    def get_failures_expression(self, test_name: str, column: str) -> str:
+        """
+        SQL aggregate counting the rows of a column failing a test, over a whole table.
+
+        Args:
+            test_name(str): Name of the test. (For now only "unique" and "not null" are supported).
+            column (str): Name of the column on which to run the test.
+        Returns:
+            str: Aggregate expression which is 0 (or null on an empty table) when the test passes.
+        """
+        expressions = {
+            # every duplicated value is counted once per extra row, nulls are ignored by both.
+            "unique": f"count({column}) - count(distinct {column})",
+            "not_null": self.count_if(f"{column} is null"),
+        }
+        return expressions[test_name]
+
+    def compile_tests_query(self, schema: str, table: str, tests: List[Tuple[str, str]]) -> str:
+        """
+        Compiles several tests of a table into a single query which scans the table only once.
+
+        Args:
+            schema (str): Name of the schema in which the table to be tested lives.
+            table (str): Name of the table to on which to run the tests.
+            tests (List[Tuple[str, str]]): Column and name of each test to run.
+        Returns:
+            str: Query returning a single row with the number of failures of each test, in order.
+        """
+        failures = ",\n    ".join(
+            f"{self.get_failures_expression(test_name, column)} as failures_{position}"
+            for position, (column, test_name) in enumerate(tests)
+        )
+        return f"select\n    {failures}\nfrom {self.get_table_reference(schema, table)}"
+
+    def count_tests_failures(
+        self, schema: str, table: str, tests: List[Tuple[str, str]]
+    ) -> List[int]:
+        """
+        Method to run several pre-defined tests of a table at once, see `compile_tests_query`.
+
+        Args:
+            schema (str): Name of the schema in which the table to be tested lives.
+            table (str): Name of the table to on which to run the tests.
+            tests (List[Tuple[str, str]]): Column and name of each test to run.
+        Returns:
+            List[int]: Exact number of failures of each test.
+        """
+        if not tests:
+            return []
+        query = self.compile_tests_query(schema, table, tests)
+        with self.engine.connect() as cursor:
+            failures = cursor.execute(query).fetchone()
+        # sums over an empty table are null.
+        return [failures_count or 0 for failures_count in failures]
+
     def execute_and_check(self, query) -> bool:
         """
         Method to run a test query and check test results.
@@ -82,8 +216,19 @@ class BaseConnector(ABC):
         Returns:
             boolean: True if the test passes, and False if it fails.
         """
+        return self.fetch_failures(query) < 1
+
+    def fetch_failures(self, query) -> int:
+        """
+        Method to run a test query and read its number of failures.
+
+        Args:
+            query(str): SQL query string to execute.
+        Returns:
+            int: First value of the first row, 0 when the query returns no row.
+        """
         with self.engine.connect() as cursor:
             result = cursor.execute(query).fetchone()
-            if result[0] < 1:
-                return True
-        return False
+        if result is None or result[0] is None:
+            return 0
+        return result[0]
@@ -3,11 +3,11 @@ Module Postgres connector.
 
 Module dependent of the base connector.
 """
-from typing import Dict
+from typing import Dict, Optional
 
 import sqlalchemy
 
-from dbt_sugar.core.connectors.base import BaseConnector
+from dbt_sugar.core.connectors.base import DEFAULT_POOL_SIZE, BaseConnector
 
 
 class PostgresConnector(BaseConnector):
@@ -20,6 +20,9 @@ class PostgresConnector(BaseConnector):
     def __init__(
         self,
         connection_params: Dict[str, str],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        count_failures: bool = False,
+        sample_size: Optional[int] = None,
     ) -> None:
         """
         Creates the URL and the Engine for future connections.
@@ -27,7 +30,16 @@ class PostgresConnector(BaseConnector):
         Args:
             connection_params (Dict[str, str]): Dict containing database connection
                 parameters and credentials.
+            pool_size (int, optional): Number of connections the engine keeps open for reuse,
+                it should be at least the number of threads running queries at once.
+            count_failures (bool, optional): When True tests count every failing row instead of
+                stopping at the first one.
+            sample_size (Optional[int], optional): When given tests only check about that many
+                rows of the tables instead of all of them.
         """
+        self.count_failures = count_failures
+        self.sample_size = sample_size
+        self._sampled_relations: Dict[str, str] = {}
         self.connection_url = sqlalchemy.engine.url.URL(
             drivername="postgresql+psycopg2",
             host=connection_params.get("host", str()),
@@ -36,4 +48,56 @@ class PostgresConnector(BaseConnector):
             database=connection_params.get("database", str()),
             port=connection_params.get("port", str()),
         )
-        self.engine = sqlalchemy.create_engine(self.connection_url)
+        self.engine = sqlalchemy.create_engine(self.connection_url, pool_size=pool_size)
+
+    def count_if(self, condition: str) -> str:
+        """
+        SQL aggregate counting the rows of a table matching a condition.
+
+        Args:
+            condition (str): SQL boolean expression.
+        Returns:
+            str: Aggregate expression using Postgres' aggregate filters.
+        """
+        return f"count(*) filter (where {condition})"
+
+    def get_table_reference(self, schema: str, table: str) -> str:
+        """
+        Reference to a table in the FROM clause of test queries, sampled when asked to.
+
+        TABLESAMPLE takes a percentage of the table, which we size from the number of rows
+        Postgres estimated when it last analyzed the table. Tables never analyzed fall back to
+        their first rows.
+
+        Args:
+            schema (str): Name of the schema in which the table lives.
+            table (str): Name of the table.
+        Returns:
+            str: Table reference.
+        """
+        relation = f"{schema}.{table}"
+        if self.sample_size is None:
+            return relation
+        if relation not in self._sampled_relations:
+            estimated_rows = self.estimate_rows(relation)
+            if estimated_rows > self.sample_size:
+                percentage = 100 * self.sample_size / estimated_rows
+                sampled_relation = f"{relation} tablesample system ({percentage:.6g})"
+            else:
+                sampled_relation = super().get_table_reference(schema, table)
+            self._sampled_relations[relation] = sampled_relation
+        return self._sampled_relations[relation]
+
+    def estimate_rows(self, relation: str) -> float:
+        """
+        Number of rows of a table as Postgres estimated it when it last analyzed the table.
+
+        Args:
+            relation (str): Schema qualified name of the table.
+        Returns:
+            float: Estimated number of rows, 0 when the table was never analyzed.
+        """
+        query = sqlalchemy.text("select reltuples from pg_class where oid = to_regclass(:relation)")
+        with self.engine.connect() as cursor:
+            estimated_rows = cursor.execute(query, {"relation": relation}).scalar()
+        return max(estimated_rows or 0, 0)
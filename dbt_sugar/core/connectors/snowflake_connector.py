@@ -3,12 +3,12 @@ Module Snowflake connector.
 
 Module dependent of the base connector.
 """
-from typing import Dict
+from typing import Dict, Optional
 
 import sqlalchemy
 from snowflake.sqlalchemy import URL
 
-from dbt_sugar.core.connectors.base import BaseConnector
+from dbt_sugar.core.connectors.base import DEFAULT_POOL_SIZE, BaseConnector
 
 
 class SnowflakeConnector(BaseConnector):
@@ -21,6 +21,9 @@ class SnowflakeConnector(BaseConnector):
     def __init__(
         self,
         connection_params: Dict[str, str],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        count_failures: bool = False,
+        sample_size: Optional[int] = None,
     ) -> None:
         """
         Creates the URL and the Engine for future connections.
@@ -28,7 +31,15 @@ class SnowflakeConnector(BaseConnector):
         Args:
             connection_params (Dict[str, str]): Dict containing database connection
                 parameters and credentials.
+            pool_size (int, optional): Number of connections the engine keeps open for reuse,
+                it should be at least the number of threads running queries at once.
+            count_failures (bool, optional): When True tests count every failing row instead of
+                stopping at the first one.
+            sample_size (Optional[int], optional): When given tests only check about that many
+                rows of the tables instead of all of them.
         """
+        self.count_failures = count_failures
+        self.sample_size = sample_size
         self.connection_url = URL(
             drivername="postgresql+psycopg2",
             user=connection_params.get("user", str()),
@@ -37,4 +48,18 @@ class SnowflakeConnector(BaseConnector):
             account=connection_params.get("account", str()),
             warehouse=connection_params.get("warehouse", str()),
         )
-        self.engine = sqlalchemy.create_engine(self.connection_url)
+        self.engine = sqlalchemy.create_engine(self.connection_url, pool_size=pool_size)
+
+    def get_table_reference(self, schema: str, table: str) -> str:
+        """
+        Reference to a table in the FROM clause of test queries, sampled when asked to.
+
+        Args:
+            schema (str): Name of the schema in which the table lives.
+            table (str): Name of the table.
+        Returns:
+            str: Table reference.
+        """
+        if self.sample_size is None:
+            return f"{schema}.{table}"
+        return f"{schema}.{table} sample ({self.sample_size} rows)"
@@ -41,3 +41,15 @@ class TargetNameNotProvided(DbtSugarException):
 
 class KnownRegressionError(DbtSugarException):
     """Thrown when we want to warn users of a known regression or limitation that is not implemented."""
+
+
+class DuplicateModelError(DbtSugarException):
+    """Thrown when several model files with the same name live in different folders of a project."""
+
+
+class InvalidSelectorError(DbtSugarException):
+    """Thrown when a model selector cannot be understood."""
+
+
+class MissingManifestError(DbtSugarException):
+    """Thrown when a feature needs the manifest.json of a dbt project and dbt has not written it."""
@@ -1,4 +1,5 @@
 """Flags module containing the FlagParser "Factory"."""
+import os
 import sys
 from argparse import ArgumentParser
 from pathlib import Path
@@ -22,6 +23,8 @@ class FlagParser:
         """
         self.cli_parser = cli_parser
         self.model: str = "test_model"
+        self.select: List[str] = []
+        self.is_non_interactive: bool = False
         self.schema: str = ""
         self.log_level: str = "info"
         self.syrup: str = str()
@@ -32,6 +35,12 @@ class FlagParser:
         self.ask_for_tags: bool = True
         self.target: str = str()
         self.verbose: bool = False
+        self.use_cache: bool = True
+        self.jobs: int = 1
+        self.lazy: bool = False
+        self.test_threads: int = 4
+        self.count_failures: bool = False
+        self.sample_tests: bool = False
 
     def consume_cli_arguments(self, test_cli_args: List[str] = list()) -> None:
         if test_cli_args:
@@ -47,6 +56,9 @@ class FlagParser:
             self.log_level = self.args.log_level
             self.verbose = self.args.verbose
             self.syrup = self.args.syrup
+            self.use_cache = self.args.use_cache
+            # --jobs without a value means "use all the cores".
+            self.jobs = self.args.jobs or os.cpu_count() or 1
             if self.args.profiles_dir:
                 self.profiles_dir = Path(self.args.profiles_dir).expanduser()
             if self.args.config_path:
@@ -55,8 +67,14 @@ class FlagParser:
         # task specific args consumption
         if self.task == "doc":
             self.model = self.args.model
+            self.select = self.args.select or []
+            self.is_non_interactive = self.args.is_non_interactive
             self.schema = self.args.schema
             self.is_dry_run = self.args.dry_run
+            self.lazy = self.args.lazy
+            self.test_threads = max(self.args.test_threads, 1)
+            self.count_failures = self.args.count_failures
+            self.sample_tests = self.args.sample_tests
             self.target = self.args.target
             # we reverse the flag so that we don't have double negatives later in the code
             self.ask_for_tests = self.args.ask_for_tests
@@ -64,3 +82,4 @@ class FlagParser:
 
         if self.task == "audit":
             self.model = self.args.model
+            self.select = self.args.select or []
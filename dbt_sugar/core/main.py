@@ -34,6 +34,13 @@ def check_and_print_version() -> str:
     return installed_version_message
 
 
+SELECT_HELP = (
+    "Models to {action} in one go. Accepts model names and globs (stg_*), folder paths relative to "
+    "the dbt project (models/staging or path:models/staging) and tags (tag:finance). Like in dbt, "
+    "+model adds the models it is built from, model+ the ones built from it and a comma "
+    "intersects selectors (tag:finance,models/marts). Graph operators need the dbt manifest."
+)
+
 # general parser
 parser = argparse.ArgumentParser(
     prog="dbt-sugar",
@@ -68,6 +75,23 @@ base_subparser.add_argument(
 base_subparser.add_argument(
     "--profiles-dir", help="Alternative path to the dbt profiles.yml file.", type=str
 )
+base_subparser.add_argument(
+    "--no-cache",
+    help="When provided dbt-sugar will re-read all your schema files instead of using its cache.",
+    action="store_false",
+    dest="use_cache",
+    default=True,
+)
+base_subparser.add_argument(
+    "-j",
+    "--jobs",
+    help="Number of processes used to read your schema files. Defaults to the number of CPUs "
+    "when passed without a value.",
+    type=int,
+    nargs="?",
+    const=0,
+    default=1,
+)
 
 # Task-specific argument sub parsers
 sub_parsers = parser.add_subparsers(title="Available dbt-sugar commands", dest="command")
@@ -77,9 +101,16 @@ document_sub_parser = sub_parsers.add_parser(
     "doc", parents=[base_subparser], help="Runs documentation and test enforement task."
 )
 document_sub_parser.set_defaults(cls=DocumentationTask, which="doc")
-# TODO: We shouldn't be requiring this if we have a `--model` format as it's considered bad practice
-document_sub_parser.add_argument(
-    "-m", "--model", help="Name of the dbt model to document", type=str, default=None, required=True
+# a doc run works either on a single model or on a selection of models.
+document_models_group = document_sub_parser.add_mutually_exclusive_group(required=True)
+document_models_group.add_argument(
+    "-m", "--model", help="Name of the dbt model to document", type=str, default=None
+)
+document_models_group.add_argument(
+    "--select",
+    help=SELECT_HELP.format(action="document"),
+    nargs="+",
+    default=None,
 )
 document_sub_parser.add_argument(
     "-s",
@@ -101,7 +132,43 @@ document_sub_parser.add_argument(
     type=str,
     default=str(),
 )
-# document_sub_parser.add_argument(
+document_sub_parser.add_argument(
+    "--lazy",
+    help="When provided dbt-sugar only loads the descriptions of the columns of the model you "
+    "document instead of building the knowledge of your whole project first.",
+    action="store_true",
+    default=False,
+)
+document_sub_parser.add_argument(
+    "--non-interactive",
+    help="When provided dbt-sugar creates or refreshes the schema.yml entries of the models with "
+    "the descriptions it already knows of without asking you anything.",
+    action="store_true",
+    dest="is_non_interactive",
+    default=False,
+)
+document_sub_parser.add_argument(
+    "--test-threads",
+    help="Number of tests dbt-sugar runs against your database at the same time.",
+    type=int,
+    default=4,
+)
+document_sub_parser.add_argument(
+    "--count-failures",
+    help="When provided failing tests report how many rows fail them. By default tests which "
+    "can't be checked in a single scan of the model stop at their first failing row.",
+    action="store_true",
+    default=False,
+)
+document_sub_parser.add_argument(
+    "--sample",
+    help="When provided tests only run on a sample of the rows of your models, its size is set "
+    "by the 'test_sample_size' of your syrup. Tests passing on a sample may still fail on the "
+    "whole model.",
+    action="store_true",
+    dest="sample_tests",
+    default=False,
+)
 
 document_sub_parser.add_argument(
     "--no-ask-tests",
@@ -138,7 +205,8 @@ audit_sub_parser = sub_parsers.add_parser(
     "audit", parents=[base_subparser], help="Runs audit task."
 )
 audit_sub_parser.set_defaults(cls=AuditTask, which="audit")
-audit_sub_parser.add_argument(
+audit_models_group = audit_sub_parser.add_mutually_exclusive_group()
+audit_models_group.add_argument(
     "-m",
     "--model",
     help="Name of the dbt model to document",
@@ -146,6 +214,9 @@ audit_sub_parser.add_argument(
     default=None,
     required=False,
 )
+audit_models_group.add_argument(
+    "--select", help=SELECT_HELP.format(action="audit"), nargs="+", default=None
+)
 
 # task handler
 
@@ -0,0 +1,159 @@
+"""Inverted index of the column descriptions found across the models of a dbt project."""
+from typing import Any, Callable, Dict, List, Set
+
+from dbt_sugar.core.project.records import DescriptionUsage, intern_string
+
+DOCUMENTED_WINS = "documented_wins"
+MOST_FREQUENT = "most_frequent"
+MOST_RECENT = "most_recent"
+CONFLICT_POLICIES = (DOCUMENTED_WINS, MOST_FREQUENT, MOST_RECENT)
+DEFAULT_CONFLICT_POLICY = DOCUMENTED_WINS
+
+
+class ColumnDescriptionIndex:
+    """Maps each column name to its descriptions and to the models using each of them.
+
+    When a column is described differently across models a conflict policy picks the one to use:
+        - `documented_wins`: the description met last in the project walk,
+        - `most_frequent`: the description used by the most models,
+        - `most_recent`: the description from the most recently modified schema file.
+
+    Whatever the policy, a real description always beats the "undocumented" placeholder and ties
+    go to the description met last. Columns are resolved as they are added so that looking up a
+    description or counting conflicts never needs another pass over the project.
+    """
+
+    def __init__(
+        self, undocumented_description: str, policy: str = DEFAULT_CONFLICT_POLICY
+    ) -> None:
+        """Constructor for ColumnDescriptionIndex.
+
+        Args:
+            undocumented_description (str): Placeholder used for columns without a description.
+            policy (str, optional): One of CONFLICT_POLICIES. Defaults to DEFAULT_CONFLICT_POLICY.
+        """
+        if policy not in CONFLICT_POLICIES:
+            raise ValueError(
+                f"'{policy}' is not a conflict policy, use one of {CONFLICT_POLICIES}."
+            )
+        self.policy = policy
+        self._undocumented_description = undocumented_description
+        # column name -> description -> models using it, modification time and position in the walk
+        self._usages: Dict[str, Dict[str, DescriptionUsage]] = {}
+        self._occurrences_count = 0
+        self._resolved: Dict[str, str] = {}
+        self._conflicting_columns: Set[str] = set()
+
+    def add(
+        self,
+        column_name: str,
+        description: str,
+        model_name: str = "",
+        modification_time_ns: int = 0,
+    ) -> str:
+        """Records that a model describes a column in a certain way.
+
+        Args:
+            column_name (str): Name of the column.
+            description (str): Description of the column in that model.
+            model_name (str, optional): Name of the model. Defaults to "".
+            modification_time_ns (int, optional): Modification time of the schema file declaring
+                the model. Only used by the `most_recent` policy. Defaults to 0.
+
+        Returns:
+            str: The description to use for that column once the conflict policy is applied.
+        """
+        column_name = intern_string(column_name)
+        description = intern_string(description)
+        self._occurrences_count += 1
+        usages = self._usages.setdefault(column_name, {})
+        usage = usages.get(description)
+        if usage is None:
+            usage = usages[description] = DescriptionUsage()
+        usage.models.append(intern_string(model_name))
+        usage.modification_time_ns = max(usage.modification_time_ns, modification_time_ns)
+        usage.last_seen = self._occurrences_count
+
+        documented_descriptions = self._documented_descriptions(column_name)
+        if len(documented_descriptions) > 1:
+            self._conflicting_columns.add(column_name)
+        self._resolved[column_name] = max(
+            documented_descriptions or list(usages),
+            key=self._sort_key(column_name),
+        )
+        return self._resolved[column_name]
+
+    def _documented_descriptions(self, column_name: str) -> List[str]:
+        return [
+            description
+            for description in self._usages[column_name]
+            if description != self._undocumented_description
+        ]
+
+    def _sort_key(self, column_name: str) -> Callable[[str], tuple]:
+        usages = self._usages[column_name]
+        if self.policy == MOST_FREQUENT:
+            return lambda description: (
+                len(usages[description].models),
+                usages[description].last_seen,
+            )
+        if self.policy == MOST_RECENT:
+            return lambda description: (
+                usages[description].modification_time_ns,
+                usages[description].last_seen,
+            )
+        return lambda description: (usages[description].last_seen,)
+
+    def get_description(self, column_name: str, default: str) -> str:
+        return self._resolved.get(column_name, default)
+
+    def get_descriptions(self, column_name: str) -> Dict[str, List[str]]:
+        """Returns each description of a column with the names of the models using it."""
+        return {
+            description: usage.models
+            for description, usage in self._usages.get(column_name, {}).items()
+        }
+
+    @property
+    def conflicts(self) -> Dict[str, Dict[str, List[str]]]:
+        """Columns which are described in more than one way, placeholder aside."""
+        return {
+            column_name: {
+                description: self._usages[column_name][description].models
+                for description in self._documented_descriptions(column_name)
+            }
+            for column_name in sorted(self._conflicting_columns)
+        }
+
+    @property
+    def conflicts_count(self) -> int:
+        return len(self._conflicting_columns)
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Returns the state of the index made of builtin types only, see `load_snapshot`."""
+        return {
+            "usages": {
+                column_name: {
+                    description: (usage.models, usage.modification_time_ns, usage.last_seen)
+                    for description, usage in usages.items()
+                }
+                for column_name, usages in self._usages.items()
+            },
+            "occurrences_count": self._occurrences_count,
+            "resolved": self._resolved,
+            "conflicting_columns": list(self._conflicting_columns),
+        }
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Restores a state returned by `to_snapshot` for the same conflict policy."""
+        self._usages = {}
+        for column_name, usages in snapshot["usages"].items():
+            self._usages[column_name] = {}
+            for description, (models, modification_time_ns, last_seen) in usages.items():
+                usage = self._usages[column_name][description] = DescriptionUsage()
+                usage.models = models
+                usage.modification_time_ns = modification_time_ns
+                usage.last_seen = last_seen
+        self._occurrences_count = snapshot["occurrences_count"]
+        self._resolved = snapshot["resolved"]
+        self._conflicting_columns = set(snapshot["conflicting_columns"])
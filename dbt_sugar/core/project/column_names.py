@@ -0,0 +1,177 @@
+"""Matches column names which only differ by their case, style or decoration.
+
+Warehouses don't agree on how they spell column names: Snowflake hands them over in upper case,
+some sources use camelCase and staging models often add prefixes such as `src_`. Names are
+normalised to lower case snake case tokens, stripped of configured prefixes and suffixes, so that
+`CUSTOMER_ID`, `customerId` and `src_customer_id` all share the same key. Names which still
+don't match exactly can be compared with a trigram index to suggest similar columns.
+"""
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from dbt_sugar.core.project.records import intern_string
+
+# splits "HTTPStatusCode2XX" into "HTTP", "Status", "Code", "2", "XX".
+_NAME_TOKEN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+|[^\W\d_]+", re.UNICODE)
+DEFAULT_SIMILARITY_THRESHOLD = 0.5
+
+
+def split_column_name(column_name: str) -> List[str]:
+    """Splits a column name on underscores, dashes, spaces, dots and camelCase humps.
+
+    Args:
+        column_name (str): Name of the column e.g. `customerID` or `CUSTOMER_ID`.
+
+    Returns:
+        List[str]: Case folded tokens of the name e.g. `["customer", "id"]`.
+    """
+    return [token.casefold() for token in _NAME_TOKEN.findall(column_name)]
+
+
+class ColumnNameNormalizer:
+    """Turns column names into normalised keys, prefixes and suffixes being whole tokens."""
+
+    def __init__(self, prefixes: Iterable[str] = (), suffixes: Iterable[str] = ()) -> None:
+        """Constructor for ColumnNameNormalizer.
+
+        Args:
+            prefixes (Iterable[str], optional): Prefixes to strip from names e.g. `src`.
+            suffixes (Iterable[str], optional): Suffixes to strip from names e.g. `tmp`.
+        """
+        self._prefixes = [tuple(split_column_name(prefix)) for prefix in prefixes or ()]
+        self._suffixes = [tuple(split_column_name(suffix)) for suffix in suffixes or ()]
+        self._cache: Dict[str, str] = {}
+
+    def normalize(self, column_name: str) -> str:
+        """Returns the normalised key of a column name e.g. `customer_id` for `SRC_CustomerId`."""
+        normalized_name = self._cache.get(column_name)
+        if normalized_name is None:
+            tokens = self._strip_affixes(split_column_name(column_name))
+            # names made of symbols only are kept as they are rather than all sharing one key.
+            normalized_name = "_".join(tokens) if tokens else column_name.casefold()
+            self._cache[column_name] = normalized_name = intern_string(normalized_name)
+        return normalized_name
+
+    def _strip_affixes(self, tokens: List[str]) -> List[str]:
+        for prefix in self._prefixes:
+            prefix_end = len(prefix)
+            if prefix and len(tokens) > prefix_end and tuple(tokens[:prefix_end]) == prefix:
+                tokens = tokens[prefix_end:]
+                break
+        for suffix in self._suffixes:
+            suffix_start = len(tokens) - len(suffix)
+            if suffix and suffix_start > 0 and tuple(tokens[suffix_start:]) == suffix:
+                tokens = tokens[:suffix_start]
+                break
+        return tokens
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded_text = f"  {text} "
+    return {"".join(trigram) for trigram in zip(padded_text, padded_text[1:], padded_text[2:])}
+
+
+class TrigramIndex:
+    """Finds the keys sharing the most trigrams with a query without comparing it to every key."""
+
+    def __init__(self) -> None:
+        self._keys: List[str] = []
+        self._trigram_counts: List[int] = []
+        # trigram -> positions in self._keys of the keys containing it
+        self._postings: Dict[str, List[int]] = {}
+
+    def add(self, key: str) -> None:
+        trigrams = _trigrams(key)
+        position = len(self._keys)
+        self._keys.append(key)
+        self._trigram_counts.append(len(trigrams))
+        for trigram in trigrams:
+            self._postings.setdefault(trigram, []).append(position)
+
+    def search(
+        self, text: str, limit: int = 3, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> List[Tuple[str, float]]:
+        """Returns up to `limit` keys whose trigram similarity with `text` reaches `threshold`.
+
+        Args:
+            text (str): Text to look for.
+            limit (int, optional): Maximum number of keys to return. Defaults to 3.
+            threshold (float, optional): Minimum Jaccard similarity of the trigram sets.
+
+        Returns:
+            List[Tuple[str, float]]: Keys and their similarity, most similar first.
+        """
+        trigrams = _trigrams(text)
+        shared_trigrams: Counter = Counter()
+        for trigram in trigrams:
+            shared_trigrams.update(self._postings.get(trigram, ()))
+
+        matches = []
+        for position, shared_count in shared_trigrams.items():
+            similarity = shared_count / (
+                len(trigrams) + self._trigram_counts[position] - shared_count
+            )
+            if similarity >= threshold:
+                matches.append((self._keys[position], similarity))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit]
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        return {
+            "keys": self._keys,
+            "trigram_counts": self._trigram_counts,
+            "postings": self._postings,
+        }
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        self._keys = snapshot["keys"]
+        self._trigram_counts = snapshot["trigram_counts"]
+        self._postings = snapshot["postings"]
+
+
+class ColumnNameIndex:
+    """Maps normalised column names back to the names they were written with in the project."""
+
+    def __init__(self, normalizer: Optional[ColumnNameNormalizer] = None) -> None:
+        """Constructor for ColumnNameIndex.
+
+        Args:
+            normalizer (Optional[ColumnNameNormalizer], optional): Normaliser to key names with.
+                Defaults to one which strips no prefix nor suffix.
+        """
+        self.normalizer = normalizer or ColumnNameNormalizer()
+        # normalised name -> name as written in a schema file
+        self._names: Dict[str, str] = {}
+        self._trigram_index = TrigramIndex()
+
+    def add(self, column_name: str, is_documented: bool = True) -> None:
+        """Records a column name, documented names take precedence over undocumented ones."""
+        normalized_name = self.normalizer.normalize(column_name)
+        if normalized_name not in self._names:
+            self._trigram_index.add(normalized_name)
+        elif not is_documented:
+            return
+        self._names[normalized_name] = column_name
+
+    def find(self, column_name: str) -> Optional[str]:
+        """Returns the project's spelling of a column which normalises like `column_name`."""
+        return self._names.get(self.normalizer.normalize(column_name))
+
+    def suggest(self, column_name: str, limit: int = 3) -> List[str]:
+        """Returns the project's spelling of columns with a similar name, most similar first."""
+        return [
+            self._names[normalized_name]
+            for normalized_name, _ in self._trigram_index.search(
+                self.normalizer.normalize(column_name), limit=limit
+            )
+        ]
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Returns the state of the index made of builtin types only, see `load_snapshot`."""
+        return {"names": self._names, "trigram_index": self._trigram_index.to_snapshot()}
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Restores a state returned by `to_snapshot` for the same prefixes and suffixes."""
+        self._names = snapshot["names"]
+        self._trigram_index.load_snapshot(snapshot["trigram_index"])
@@ -0,0 +1,92 @@
+"""Lineage of the models of a dbt project, as recorded by dbt in its manifest.json."""
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from dbt_sugar.core.clients.manifest import DbtManifest, ManifestParsingError
+
+MODEL_UNIQUE_ID_PREFIX = "model."
+
+
+def model_name_from_unique_id(unique_id: str) -> Optional[str]:
+    """Returns the name of a model from its unique id e.g. `model.jaffle_shop.orders`."""
+    if not unique_id.startswith(MODEL_UNIQUE_ID_PREFIX):
+        return None
+    parts = unique_id.split(".")
+    return parts[2] if len(parts) > 2 else None
+
+
+class ModelGraph:
+    """Adjacency index of the nodes of a dbt project, built once from the manifest's parent map.
+
+    Every node (sources, seeds, snapshots...) is kept so that lineage flowing through them is
+    followed but only models are ever returned.
+    """
+
+    def __init__(self, parent_map: Dict[str, List[str]]) -> None:
+        """Constructor for ModelGraph.
+
+        Args:
+            parent_map (Dict[str, List[str]]): Unique ids of the parents of each node.
+        """
+        self._parents: Dict[str, List[str]] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._model_ids_by_name: Dict[str, List[str]] = {}
+        for unique_id, parent_ids in parent_map.items():
+            self._add_node(unique_id)
+            self._parents[unique_id] = list(parent_ids)
+            for parent_id in parent_ids:
+                self._add_node(parent_id)
+                self._children[parent_id].append(unique_id)
+
+    def _add_node(self, unique_id: str) -> None:
+        if unique_id in self._children:
+            return
+        self._children[unique_id] = []
+        self._parents.setdefault(unique_id, [])
+        model_name = model_name_from_unique_id(unique_id)
+        if model_name:
+            self._model_ids_by_name.setdefault(model_name, []).append(unique_id)
+
+    @classmethod
+    def from_manifest(cls, manifest: DbtManifest) -> "ModelGraph":
+        """Builds the graph from the `parent_map` of a manifest, the rest of it is skipped.
+
+        Raises:
+            ManifestParsingError: When the manifest has no parent map.
+        """
+        parent_map = manifest.read_top_level_value("parent_map")
+        if not isinstance(parent_map, dict):
+            raise ManifestParsingError(f"{manifest.manifest_path} has no parent map.")
+        return cls(parent_map)
+
+    def upstream(self, model_names: Iterable[str], depth: Optional[int] = None) -> Set[str]:
+        """Returns the models the given models are built from, at most `depth` levels up."""
+        return self._walk(model_names, self._parents, depth)
+
+    def downstream(self, model_names: Iterable[str], depth: Optional[int] = None) -> Set[str]:
+        """Returns the models built from the given models, at most `depth` levels down."""
+        return self._walk(model_names, self._children, depth)
+
+    def _walk(
+        self, model_names: Iterable[str], adjacency: Dict[str, List[str]], depth: Optional[int]
+    ) -> Set[str]:
+        visited: Set[str] = set()
+        to_visit: Deque[Tuple[str, int]] = deque()
+        for model_name in model_names:
+            for unique_id in self._model_ids_by_name.get(model_name, ()):
+                visited.add(unique_id)
+                to_visit.append((unique_id, 0))
+        # breadth first so that nodes are reached by their shortest path, which depth limits.
+        while to_visit:
+            unique_id, distance = to_visit.popleft()
+            if depth is not None and distance >= depth:
+                continue
+            for neighbour_id in adjacency.get(unique_id, ()):
+                if neighbour_id not in visited:
+                    visited.add(neighbour_id)
+                    to_visit.append((neighbour_id, distance + 1))
+        return {
+            model_name
+            for model_name in map(model_name_from_unique_id, visited)
+            if model_name is not None
+        }
@@ -0,0 +1,316 @@
+"""Holds the inventory of the schema and model files which make up a dbt project."""
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+import yaml
+
+from dbt_sugar.core.clients.yaml_helpers import open_yaml
+from dbt_sugar.core.exceptions import DuplicateModelError, YAMLFileEmptyError
+from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+
+DEFAULT_EXCLUDED_YML_FILES = r"dbt_project.yml|packages.yml"
+DBT_PROJECT_FILENAME = "dbt_project.yml"
+# dbt >= 1.0 calls them model-paths, older versions source-paths.
+MODEL_PATHS_KEYS = ("model-paths", "source-paths")
+DEFAULT_MODEL_PATHS = ["models"]
+# gitignore-style patterns: dbt's build, packages and logs folders plus our own cache.
+DEFAULT_EXCLUDED_PATHS = [
+    "target/",
+    "dbt_modules/",
+    "dbt_packages/",
+    "/logs/",
+    ".git/",
+    ".dbt_sugar/",
+]
+
+
+def _translate_glob(glob: str) -> str:
+    """Translates a gitignore-style glob into a regex that never lets `*` and `?` cross a `/`."""
+    regex = []
+    index = 0
+    while index < len(glob):
+        if glob.startswith("**/", index):
+            regex.append("(?:.*/)?")
+            index += 3
+        elif glob.startswith("**", index):
+            regex.append(".*")
+            index += 2
+        elif glob[index] == "*":
+            regex.append("[^/]*")
+            index += 1
+        elif glob[index] == "?":
+            regex.append("[^/]")
+            index += 1
+        elif glob[index] == "[" and glob.find("]", index + 1) > 0:
+            class_start = index + 1
+            closing_index = glob.index("]", class_start)
+            character_class = glob[class_start:closing_index].replace("\\", "\\\\")
+            if character_class.startswith("!"):
+                character_class = "^" + character_class[1:]
+            regex.append(f"[{character_class}]")
+            index = closing_index + 1
+        else:
+            regex.append(re.escape(glob[index]))
+            index += 1
+    return "".join(regex)
+
+
+class PathExclusionRules:
+    """Decides which paths of a dbt project are out of dbt-sugar's scope.
+
+    Patterns follow the `.gitignore` (and `.dbtignore`) syntax:
+        - `folder` matches a file or folder with that name at any depth,
+        - `folder/` only matches folders,
+        - patterns containing a `/` such as `/logs` or `models/legacy` are relative to the
+          root of the dbt project,
+        - `*`, `?`, `[...]` and `**` work like in gitignore,
+        - `!pattern` re-includes what a previous pattern excluded.
+
+    Patterns are compiled once and the last pattern matching a path decides its fate.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Constructor for PathExclusionRules.
+
+        Args:
+            patterns (Iterable[str]): gitignore-style patterns of the paths to exclude.
+        """
+        self.patterns: List[str] = []
+        self._rules: List[Tuple[Pattern, bool, bool]] = []
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            self.patterns.append(pattern)
+            self._rules.append(self._compile(pattern))
+
+    @staticmethod
+    def _compile(pattern: str) -> Tuple[Pattern, bool, bool]:
+        is_negated = pattern.startswith("!")
+        if is_negated:
+            pattern = pattern[1:]
+        is_dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if "/" in pattern:
+            regex = _translate_glob(pattern.lstrip("/"))
+        else:
+            regex = "(?:.*/)?" + _translate_glob(pattern)
+        return re.compile(f"^{regex}$"), is_negated, is_dir_only
+
+    def is_excluded(self, relative_path: str, is_dir: bool = False) -> bool:
+        """Checks whether a path is excluded.
+
+        Args:
+            relative_path (str): `/` separated path relative to the root of the dbt project.
+            is_dir (bool, optional): Whether the path points to a folder. Defaults to False.
+
+        Returns:
+            bool: True when the path should be left out.
+        """
+        for regex, is_negated, is_dir_only in reversed(self._rules):
+            if is_dir_only and not is_dir:
+                continue
+            if regex.match(relative_path):
+                return not is_negated
+        return False
+
+    def is_excluded_path(self, relative_path: str) -> bool:
+        """Checks whether a file or any of the folders it lives in is excluded.
+
+        Args:
+            relative_path (str): `/` separated path to a file relative to the dbt project root.
+
+        Returns:
+            bool: True when the file should be left out.
+        """
+        parts = relative_path.strip("/").split("/")
+        for depth in range(1, len(parts)):
+            if self.is_excluded("/".join(parts[:depth]), is_dir=True):
+                return True
+        return self.is_excluded("/".join(parts))
+
+
+# Where a folder stands with regard to the model paths of its dbt project: None outside of any
+# dbt project, True inside a model path, False outside of them, otherwise the folder names left to
+# reach each model path.
+ModelScope = Union[None, bool, Tuple[Tuple[str, ...], ...]]
+
+
+def _narrow_model_scope(model_paths_parts: Tuple[Tuple[str, ...], ...]) -> ModelScope:
+    if () in model_paths_parts:
+        return True
+    return model_paths_parts or False
+
+
+def _read_model_scope(dbt_project_file: Path) -> ModelScope:
+    """Scope of the folder holding a dbt_project.yml, built from its model paths."""
+    model_paths = DEFAULT_MODEL_PATHS
+    try:
+        dbt_project = open_yaml(dbt_project_file)
+    except (OSError, yaml.YAMLError, YAMLFileEmptyError) as error:
+        logger.debug(f"Could not read {dbt_project_file}, using the default model paths: {error}")
+    else:
+        if isinstance(dbt_project, dict):
+            model_paths = next(
+                (dbt_project[key] for key in MODEL_PATHS_KEYS if dbt_project.get(key)),
+                DEFAULT_MODEL_PATHS,
+            )
+    if isinstance(model_paths, str):
+        model_paths = [model_paths]
+    return _narrow_model_scope(
+        tuple(
+            tuple(part for part in re.split(r"[/\\]", str(model_path)) if part not in ("", "."))
+            for model_path in model_paths
+        )
+    )
+
+
+def _get_sub_folder_model_scope(scope: ModelScope, folder_name: str) -> ModelScope:
+    if scope is None or isinstance(scope, bool):
+        return scope
+    return _narrow_model_scope(tuple(parts[1:] for parts in scope if parts[0] == folder_name))
+
+
+class ProjectInventory:
+    """Lists all the schema (.yml) and model (.sql) files of a dbt project in a single walk.
+
+    The inventory is built once per run and then queried by every task method that needs to
+    look for files so that we never walk the project tree more than once. Excluded folders are
+    pruned before we descend into them so their content is never even listed.
+
+    Only the .sql files in the model paths of their dbt project are models, so that tests, macros
+    or analyses sharing the name of a model are not mistaken for it. The .sql files outside of any
+    dbt project are all models.
+    """
+
+    def __init__(
+        self, repository_path: Union[str, Path], exclusion_rules: PathExclusionRules
+    ) -> None:
+        """Constructor for ProjectInventory.
+
+        Args:
+            repository_path (Union[str, Path]): Path to the dbt project to take an inventory of.
+            exclusion_rules (PathExclusionRules): Rules telling which paths should be left out.
+        """
+        self.repository_path = repository_path
+        self._exclusion_rules = exclusion_rules
+        self._excluded_yml_files_pattern = re.compile(DEFAULT_EXCLUDED_YML_FILES)
+
+        # populated by class methods
+        self.schema_files: List[Path] = []
+        self.model_files: List[Path] = []
+        self.files_by_directory: Dict[Path, List[Path]] = {}
+        self.model_files_by_name: Dict[str, List[Path]] = {}
+        # relative path, mtime and size of every schema and model file, in walk order.
+        self.file_fingerprints: List[Tuple[str, int, int]] = []
+        self.build()
+
+    def build(self) -> None:
+        """Walks the dbt project once and sorts the files we care about by type and directory.
+
+        Folders are visited depth first and in alphabetical order so that files always come out in
+        the same order whatever the file system. Files are stat'ed as they are listed so that
+        callers can tell whether anything changed since a previous run without another sweep.
+        """
+        # stack of (folder path, folder path relative to the project root, folder model scope)
+        folders_to_visit: List[Tuple[str, str, ModelScope]] = [
+            (os.fspath(self.repository_path), "", None)
+        ]
+        while folders_to_visit:
+            folder, relative_folder, model_scope = folders_to_visit.pop()
+            try:
+                with os.scandir(folder) as scanned_entries:
+                    entries = sorted(scanned_entries, key=lambda entry: entry.name)
+            except OSError as error:
+                logger.debug(f"Could not list the content of {folder}: {error}")
+                continue
+            if any(entry.name == DBT_PROJECT_FILENAME and entry.is_file() for entry in entries):
+                model_scope = _read_model_scope(Path(folder, DBT_PROJECT_FILENAME))
+            is_model_folder = model_scope is None or model_scope is True
+
+            sub_folders = []
+            folder_files = []
+            for entry in entries:
+                relative_path = f"{relative_folder}{entry.name}"
+                if entry.is_dir():
+                    # like os.walk we do not follow symlinks to folders.
+                    if entry.is_symlink() or self._exclusion_rules.is_excluded(
+                        relative_path, is_dir=True
+                    ):
+                        continue
+                    sub_folders.append(
+                        (
+                            entry.path,
+                            f"{relative_path}/",
+                            _get_sub_folder_model_scope(model_scope, entry.name),
+                        )
+                    )
+                    continue
+
+                lowered_name = entry.name.lower()
+                if lowered_name.endswith(".yml"):
+                    if self._excluded_yml_files_pattern.search(lowered_name):
+                        continue
+                    is_schema_file = True
+                elif entry.name.endswith(".sql"):
+                    is_schema_file = False
+                else:
+                    continue
+                if self._exclusion_rules.is_excluded(relative_path):
+                    continue
+
+                path_file = Path(entry.path)
+                try:
+                    stat = entry.stat()
+                except OSError as error:
+                    logger.debug(f"Could not stat {entry.path}: {error}")
+                    continue
+                self.file_fingerprints.append((relative_path, stat.st_mtime_ns, stat.st_size))
+                if not (is_schema_file or is_model_folder):
+                    # still fingerprinted, dbt's manifest depends on tests and analyses too.
+                    continue
+                folder_files.append(path_file)
+                if is_schema_file:
+                    self.schema_files.append(path_file)
+                else:
+                    self.model_files.append(path_file)
+                    self.model_files_by_name.setdefault(path_file.stem, []).append(path_file)
+
+            if folder_files:
+                self.files_by_directory[Path(folder)] = folder_files
+            # reversed so that the alphabetically first folder is popped first.
+            folders_to_visit.extend(reversed(sub_folders))
+
+        logger.debug(
+            f"Found {len(self.schema_files)} schema files and {len(self.model_files)} model files "
+            f"in {self.repository_path}"
+        )
+
+    @property
+    def latest_modification_time_ns(self) -> int:
+        """Most recent modification time of the schema and model files of the project."""
+        # the walk stat'ed every file already.
+        return max((mtime_ns for _, mtime_ns, _ in self.file_fingerprints), default=0)
+
+    def get_model_file(self, model_name: str) -> Optional[Path]:
+        """Returns the path to the .sql file of a model.
+
+        Args:
+            model_name (str): Name of the model to look for.
+
+        Raises:
+            DuplicateModelError: When more than one model file carries that name.
+
+        Returns:
+            Optional[Path]: Path to the model file or None when the model does not exist.
+        """
+        model_files = self.model_files_by_name.get(model_name, [])
+        if len(model_files) > 1:
+            duplicates = "\n".join(f"  - {model_file}" for model_file in model_files)
+            raise DuplicateModelError(
+                f"The model name '{model_name}' is used by more than one file:\n{duplicates}\n"
+                "dbt requires model names to be unique. Rename or exclude one of them."
+            )
+        return model_files[0] if model_files else None
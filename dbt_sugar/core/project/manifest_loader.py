@@ -0,0 +1,189 @@
+"""Builds dbt-sugar's knowledge of a dbt project from its manifest.json instead of its schema files."""
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from dbt_sugar.core.clients.manifest import DEFAULT_MANIFEST_PATH, DbtManifest
+from dbt_sugar.core.clients.yaml_helpers import open_yaml
+from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+from dbt_sugar.core.project.inventory import PathExclusionRules, ProjectInventory
+
+# since dbt 0.20 patch paths are prefixed by the package they belong to e.g. "jaffle_shop://"
+PATCH_PATH_PACKAGE_PREFIX = re.compile(r"^[\w-]+://")
+# test kwargs which only tell what the test is attached to.
+TEST_TARGET_KWARGS = ("column_name", "model")
+# e.g. "{{ get_where_subquery(ref('orders')) }}", the model a generic test is declared on.
+REF_CALL = re.compile(r"""\bref\(\s*(?:['"][^'"]+['"]\s*,\s*)?['"]([^'"]+)['"]\s*\)""")
+# the manifest only holds rendered descriptions, the raw text is needed to keep `{{ doc("...") }}`.
+DOC_REFERENCE = re.compile(r"{{\s*doc\(")
+
+
+def _test_definition(test_node: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+    """Rebuilds a test the way it is written in a schema.yml e.g. `unique` or `{relationships: ...}`."""
+    test_metadata = test_node.get("test_metadata") or {}
+    test_name = test_metadata.get("name") or test_node["name"]
+    if test_metadata.get("namespace"):
+        test_name = f"{test_metadata['namespace']}.{test_name}"
+    test_kwargs = {
+        key: value
+        for key, value in (test_metadata.get("kwargs") or {}).items()
+        if key not in TEST_TARGET_KWARGS
+    }
+    if test_kwargs:
+        return {test_name: test_kwargs}
+    return test_name
+
+
+def _tested_model(test_node: Dict[str, Any]) -> Optional[str]:
+    """Unique id of the model a test is attached to, None when it can't be told for sure.
+
+    Tests such as `relationships` depend on more than one model, without an `attached_node`
+    (dbt < 1.5) the `model` argument of the test tells which one it is declared on.
+    """
+    attached_node = test_node.get("attached_node")
+    if attached_node:
+        return attached_node if attached_node.startswith("model.") else None
+    models = [uid for uid in test_node["depends_on"].get("nodes", []) if uid.startswith("model.")]
+    if len(models) <= 1:
+        return models[0] if models else None
+    test_kwargs = (test_node.get("test_metadata") or {}).get("kwargs") or {}
+    reference = REF_CALL.search(str(test_kwargs.get("model", "")))
+    if not reference:
+        return None
+    referenced_models = [uid for uid in models if uid.split(".")[2:3] == [reference.group(1)]]
+    return referenced_models[0] if len(referenced_models) == 1 else None
+
+
+def _walk_order_key(relative_path: str) -> Tuple[Tuple[int, str], ...]:
+    """Sorts paths the way ProjectInventory walks them: a folder's files before its sub folders."""
+    *folders, file_name = relative_path.split("/")
+    return tuple((1, folder) for folder in folders) + ((0, file_name),)
+
+
+class ManifestProjectLoader:
+    """Reads models, column descriptions and tests from dbt's manifest.json.
+
+    The manifest can only be trusted when it is newer than every source file of the project, when
+    it is not, `get_schema_contents` returns None and callers should fall back to reading the
+    schema files.
+    """
+
+    def __init__(
+        self,
+        repository_path: Union[str, Path],
+        project_inventory: ProjectInventory,
+        exclusion_rules: PathExclusionRules,
+    ) -> None:
+        """Constructor for ManifestProjectLoader.
+
+        Args:
+            repository_path (Union[str, Path]): Path to the dbt project.
+            project_inventory (ProjectInventory): Inventory of the project's files.
+            exclusion_rules (PathExclusionRules): Rules telling which paths should be left out.
+        """
+        self.repository_path = repository_path
+        self._project_inventory = project_inventory
+        self._exclusion_rules = exclusion_rules
+        self.manifest = DbtManifest(Path(repository_path, DEFAULT_MANIFEST_PATH))
+
+    @property
+    def _dbt_project_file(self) -> Path:
+        return Path(self.repository_path, "dbt_project.yml")
+
+    def is_manifest_fresh(self) -> bool:
+        """Checks that a manifest exists and that no project file was modified after it."""
+        if not self.manifest.exists() or not self._dbt_project_file.is_file():
+            return False
+        latest_source_modification = max(
+            self._project_inventory.latest_modification_time_ns,
+            self._dbt_project_file.stat().st_mtime_ns,
+        )
+        return self.manifest.modification_time_ns > latest_source_modification
+
+    def get_schema_contents(self) -> Optional[List[Tuple[Path, Dict[str, Any]]]]:
+        """Rebuilds the content of each schema file of the project from the manifest.
+
+        Returns:
+            Optional[List[Tuple[Path, Dict[str, Any]]]]: Path and summarised content of each schema
+                file in the order the project is walked or None when the manifest cannot be used.
+        """
+        if not self.is_manifest_fresh():
+            logger.debug(f"{self.manifest.manifest_path} is missing or stale.")
+            return None
+        try:
+            return self._read_schema_contents()
+        except (KeyError, TypeError, ValueError, OSError) as error:
+            logger.debug(f"Could not read {self.manifest.manifest_path}: {error!r}")
+            return None
+
+    def _read_schema_contents(self) -> List[Tuple[Path, Dict[str, Any]]]:
+        project_name = open_yaml(self._dbt_project_file).get("name")
+        models: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        column_tests: Dict[Tuple[str, str], List[Union[str, Dict[str, Any]]]] = {}
+        for unique_id, node in self.manifest.iter_nodes():
+            if node.get("package_name") != project_name:
+                continue
+            if node["resource_type"] == "model":
+                # models which are not in any schema file are not documented at all.
+                if not node.get("patch_path"):
+                    continue
+                schema_path = PATCH_PATH_PACKAGE_PREFIX.sub("", node["patch_path"])
+                schema_path = schema_path.replace("\\", "/")
+                model_path = node["original_file_path"].replace("\\", "/")
+                if any(
+                    self._exclusion_rules.is_excluded_path(path)
+                    for path in (schema_path, model_path)
+                ):
+                    continue
+                models[unique_id] = (schema_path, node)
+            else:
+                test_metadata = node.get("test_metadata") or {}
+                column_name = node.get("column_name") or test_metadata.get("kwargs", {}).get(
+                    "column_name"
+                )
+                tested_model = _tested_model(node)
+                if column_name and tested_model:
+                    column_tests.setdefault((tested_model, column_name), []).append(
+                        _test_definition(node)
+                    )
+
+        schema_contents: Dict[str, Dict[str, Any]] = {}
+        for unique_id, (schema_path, node) in models.items():
+            columns = []
+            for column in node.get("columns", {}).values():
+                column_summary = {"name": column["name"], "description": column.get("description")}
+                tests = column_tests.get((unique_id, column["name"]))
+                if tests:
+                    column_summary["tests"] = tests
+                columns.append(column_summary)
+            schema_content = schema_contents.setdefault(schema_path, {"models": []})
+            schema_content["models"].append({"name": node["name"], "columns": columns})
+
+        for schema_path, schema_content in schema_contents.items():
+            self._restore_doc_references(Path(self.repository_path, schema_path), schema_content)
+
+        logger.debug(f"Loaded {len(models)} models from {self.manifest.manifest_path}")
+        return [
+            (Path(self.repository_path, schema_path), schema_contents[schema_path])
+            for schema_path in sorted(schema_contents, key=_walk_order_key)
+        ]
+
+    @staticmethod
+    def _restore_doc_references(schema_path: Path, schema_content: Dict[str, Any]) -> None:
+        """Puts back the raw descriptions of a schema file which references doc blocks.
+
+        Only the files mentioning a doc block are parsed, the other ones keep the manifest's
+        descriptions.
+        """
+        if not DOC_REFERENCE.search(schema_path.read_text(encoding="utf-8")):
+            return
+        raw_descriptions = {
+            (model.get("name"), column.get("name")): column.get("description")
+            for model in open_yaml(schema_path).get("models") or []
+            for column in model.get("columns") or []
+        }
+        for model in schema_content["models"]:
+            for column in model["columns"]:
+                raw_description = raw_descriptions.get((model["name"], column["name"]))
+                if isinstance(raw_description, str) and DOC_REFERENCE.search(raw_description):
+                    column["description"] = raw_description
@@ -0,0 +1,64 @@
+"""Cheap check of whether a file could mention some words, run before parsing it as YAML."""
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Union
+
+# above this size files are memory-mapped instead of being read into memory.
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+
+class RawTextPrefilter:
+    """Scans the raw bytes of files for any of a set of words with a single compiled regex.
+
+    A match does not guarantee that the file declares one of the words (it could be in a
+    description or a comment) but no match guarantees that it does not, which is enough to skip
+    parsing most of the schema files of a project.
+    """
+
+    def __init__(
+        self, words: Iterable[str], ignore_case: bool = False, whole_words: bool = True
+    ) -> None:
+        """Constructor for RawTextPrefilter.
+
+        Args:
+            words (Iterable[str]): Words to look for.
+            ignore_case (bool, optional): Whether ASCII letters match whatever their case.
+                Defaults to False.
+            whole_words (bool, optional): Whether words must not be glued to other letters, digits
+                or underscores, like column names in a YAML file. Defaults to True.
+        """
+        # longest first so that the alternation prefers `customer_id` over `customer`.
+        alternatives = sorted(
+            {re.escape(word.encode("utf-8")) for word in words if word}, key=len, reverse=True
+        )
+        self._pattern = None
+        if alternatives:
+            pattern = b"(?:" + b"|".join(alternatives) + b")"
+            if whole_words:
+                pattern = rb"(?<!\w)" + pattern + rb"(?!\w)"
+            self._pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+    def matches(self, raw_content: bytes) -> bool:
+        return self._pattern is not None and self._pattern.search(raw_content) is not None
+
+    def might_mention(self, path: Union[str, Path]) -> bool:
+        """Checks whether a file contains any of the words.
+
+        Args:
+            path (Union[str, Path]): Path to the file to scan.
+
+        Returns:
+            bool: False when the file certainly does not contain any of the words.
+        """
+        if self._pattern is None:
+            return False
+        with open(path, "rb") as stream:
+            size = os.fstat(stream.fileno()).st_size
+            if size == 0:
+                return False
+            if size < MMAP_THRESHOLD_BYTES:
+                return self.matches(stream.read())
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped_content:
+                return self._pattern.search(mapped_content) is not None  # type: ignore
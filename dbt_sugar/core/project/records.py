@@ -0,0 +1,63 @@
+"""Compact records holding what dbt-sugar knows about the models of a project.
+
+Big projects declare hundreds of thousands of columns, mostly reusing the same names, descriptions
+and tests. Records are slotted so that they don't carry a `__dict__` each and their strings are
+interned so that each distinct name, description or test is only held in memory once.
+"""
+import sys
+from typing import Any, Iterable, List, Tuple
+
+
+def intern_string(value: Any) -> Any:
+    """Interns strings, anything else (None, test definitions with arguments...) is left as is."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class ColumnTests:
+    """Tests declared on a column of a model."""
+
+    __slots__ = ("name", "tests")
+
+    def __init__(self, name: str, tests: Iterable[Any] = ()) -> None:
+        """Constructor for ColumnTests.
+
+        Args:
+            name (str): Name of the column.
+            tests (Iterable[Any], optional): Test names or definitions such as
+                `{"accepted_values": {...}}`. Defaults to no tests.
+        """
+        self.name: str = intern_string(name)
+        self.tests: Tuple[Any, ...] = tuple(intern_string(test) for test in tests or ())
+
+    @classmethod
+    def restore(cls, name: str, tests: Tuple[Any, ...]) -> "ColumnTests":
+        """Rebuilds a record from values which are already interned, skipping the constructor."""
+        record = cls.__new__(cls)
+        record.name = name
+        record.tests = tests
+        return record
+
+    def __eq__(self, other: object) -> bool:
+        """Records are equal when they hold the same column name and tests."""
+        if not isinstance(other, ColumnTests):
+            return NotImplemented
+        return self.name == other.name and self.tests == other.tests
+
+    def __repr__(self) -> str:
+        """Shows the column name and tests, mainly for test failures."""
+        return f"ColumnTests(name={self.name!r}, tests={self.tests!r})"
+
+
+class DescriptionUsage:
+    """Models using a description of a column and when that description was last seen."""
+
+    __slots__ = ("models", "modification_time_ns", "last_seen")
+
+    def __init__(self) -> None:
+        self.models: List[str] = []
+        # latest modification time of a schema file using the description.
+        self.modification_time_ns = 0
+        # position of the last occurrence of the description in the project walk.
+        self.last_seen = 0
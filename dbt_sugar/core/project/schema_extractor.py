@@ -0,0 +1,176 @@
+"""Extracts the models and columns of a schema file from its YAML parse events.
+
+Loading a schema file builds the whole tree of its content (docs blocks, sources, meta, configs...)
+when indexing it only needs the names of its models and a few keys of their columns. The parser's
+events are consumed as they come instead: the needed values are built and everything else is
+skipped without ever being turned into Python objects.
+"""
+import collections
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence
+
+import yaml
+
+# whatever PyYAML was built with, the C parser when libyaml is available.
+_EVENT_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_MISSING = object()
+
+
+class UnsupportedSchemaDocumentError(Exception):
+    """Raised when a document needs a full load to be read like `open_yaml` would read it.
+
+    That's the case of documents using aliases or merge keys, which can bring keys from elsewhere
+    in the document, and of documents which are empty or shaped unlike a schema file.
+    """
+
+
+class _SchemaEventExtractor:
+    def __init__(self, stream: IO[str], column_keys: Sequence[str]) -> None:
+        self._events: Iterator[yaml.Event] = yaml.parse(stream, Loader=_EVENT_LOADER)
+        self._column_keys = column_keys
+        self._resolver = yaml.resolver.Resolver()
+        self._constructor = yaml.constructor.SafeConstructor()
+
+    def extract(self) -> Dict[str, Any]:
+        self._expect(yaml.StreamStartEvent)
+        if isinstance(self._next(), yaml.StreamEndEvent):
+            raise UnsupportedSchemaDocumentError("The document is empty.")
+        if not isinstance(self._next(), yaml.MappingStartEvent):
+            raise UnsupportedSchemaDocumentError("The document is not a mapping.")
+
+        models: List[Dict[str, Any]] = []
+        is_empty = True
+        for key in self._iter_mapping_keys():
+            is_empty = False
+            if key == "models":
+                models = self._read_models()
+            else:
+                self._skip_node()
+        if is_empty:
+            raise UnsupportedSchemaDocumentError("The document is an empty mapping.")
+
+        self._expect(yaml.DocumentEndEvent)
+        if not isinstance(self._next(), yaml.StreamEndEvent):
+            raise UnsupportedSchemaDocumentError("The stream holds more than one document.")
+        return {"models": models}
+
+    def _next(self) -> yaml.Event:
+        return next(self._events)
+
+    def _expect(self, event_class: type) -> None:
+        if not isinstance(self._next(), event_class):
+            raise UnsupportedSchemaDocumentError(f"Expected a {event_class.__name__}.")
+
+    def _iter_mapping_keys(self) -> Iterator[Any]:
+        """Yields the keys of the mapping being read, its values must be consumed in between."""
+        while True:
+            event = self._next()
+            if isinstance(event, yaml.MappingEndEvent):
+                return
+            if not isinstance(event, yaml.ScalarEvent):
+                raise UnsupportedSchemaDocumentError("Complex keys and aliases need a full load.")
+            yield self._scalar_value(event)
+
+    def _scalar_value(self, event: yaml.ScalarEvent) -> Any:
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = self._resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag == "tag:yaml.org,2002:str":
+            return event.value
+        if tag == "tag:yaml.org,2002:merge":
+            raise UnsupportedSchemaDocumentError("Merge keys need a full load.")
+        return self._constructor.construct_object(
+            yaml.ScalarNode(tag, event.value, style=event.style)
+        )
+
+    def _read_node(self, event: Optional[yaml.Event] = None) -> Any:
+        """Builds the value starting with `event`, like the full load would."""
+        event = event or self._next()
+        if isinstance(event, yaml.ScalarEvent):
+            return self._scalar_value(event)
+        if isinstance(event, yaml.SequenceStartEvent):
+            items = []
+            event = self._next()
+            while not isinstance(event, yaml.SequenceEndEvent):
+                items.append(self._read_node(event))
+                event = self._next()
+            return items
+        if isinstance(event, yaml.MappingStartEvent):
+            mapping: Dict[Any, Any] = collections.OrderedDict()
+            for key in self._iter_mapping_keys():
+                mapping[key] = self._read_node()
+            return mapping
+        raise UnsupportedSchemaDocumentError("Aliases need a full load.")
+
+    def _skip_node(self) -> None:
+        depth = 0
+        while True:
+            event = self._next()
+            if isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+                depth += 1
+            elif isinstance(event, (yaml.SequenceEndEvent, yaml.MappingEndEvent)):
+                depth -= 1
+            if depth == 0:
+                return
+
+    def _iter_sequence_of_mappings(self) -> Iterator[None]:
+        """Yields once per mapping of a sequence, which must be read in between.
+
+        Null or empty values are read as an empty sequence like `content.get(key) or []` does.
+        """
+        event = self._next()
+        if isinstance(event, yaml.ScalarEvent) and not self._scalar_value(event):
+            return
+        if not isinstance(event, yaml.SequenceStartEvent):
+            raise UnsupportedSchemaDocumentError("Expected a sequence of mappings.")
+        while True:
+            event = self._next()
+            if isinstance(event, yaml.SequenceEndEvent):
+                return
+            if not isinstance(event, yaml.MappingStartEvent):
+                raise UnsupportedSchemaDocumentError("Expected a sequence of mappings.")
+            yield
+
+    def _read_models(self) -> List[Dict[str, Any]]:
+        models = []
+        for _ in self._iter_sequence_of_mappings():
+            name: Any = _MISSING
+            columns: List[Dict[str, Any]] = []
+            for key in self._iter_mapping_keys():
+                if key == "name":
+                    name = self._read_node()
+                elif key == "columns":
+                    columns = self._read_columns()
+                else:
+                    self._skip_node()
+            if name is _MISSING:
+                raise UnsupportedSchemaDocumentError("A model has no name.")
+            models.append({"name": name, "columns": columns})
+        return models
+
+    def _read_columns(self) -> List[Dict[str, Any]]:
+        columns = []
+        for _ in self._iter_sequence_of_mappings():
+            column = {}
+            for key in self._iter_mapping_keys():
+                if key in self._column_keys:
+                    column[key] = self._read_node()
+                else:
+                    self._skip_node()
+            columns.append({key: column[key] for key in self._column_keys if key in column})
+        return columns
+
+
+def extract_schema_summary(stream: IO[str], column_keys: Sequence[str]) -> Dict[str, Any]:
+    """Reads the models of a schema file and the given keys of their columns.
+
+    Args:
+        stream (IO[str]): Stream of the schema file.
+        column_keys (Sequence[str]): Keys of the columns to extract e.g. `("name", "description")`.
+
+    Raises:
+        UnsupportedSchemaDocumentError: When the document must be fully loaded to be read.
+
+    Returns:
+        Dict[str, Any]: A dict shaped like a schema.yml with only the models and their columns.
+    """
+    return _SchemaEventExtractor(stream, column_keys).extract()
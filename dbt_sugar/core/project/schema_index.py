@@ -0,0 +1,235 @@
+"""Persistent on-disk index of the models, columns and tests declared in schema files.
+
+Parsing every schema.yml of a large dbt project on each run is slow. The index keeps, for each
+schema file, the subset of its content dbt-sugar cares about together with a fingerprint of the
+file (mtime, size and content hash) so that unchanged files do not need to be parsed again.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from dbt_sugar.core.clients.yaml_helpers import open_yaml
+from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+from dbt_sugar.core.project.prefilter import RawTextPrefilter
+from dbt_sugar.core.project.schema_extractor import (
+    UnsupportedSchemaDocumentError,
+    extract_schema_summary,
+)
+
+CACHE_FOLDER = Path(".dbt_sugar", "cache")
+SCHEMA_INDEX_FILENAME = "schema_index.json"
+# bump this whenever the shape of what we store in the index changes.
+SCHEMA_INDEX_FORMAT_VERSION = 1
+
+COLUMN_KEYS_TO_INDEX = ("name", "description", "tests")
+
+
+def summarise_schema_content(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Only retains the parts of a schema.yml content that dbt-sugar needs to build its knowledge.
+
+    Args:
+        content (Dict[str, Any]): Full content of a schema.yml.
+
+    Returns:
+        Dict[str, Any]: A dict shaped like a schema.yml with only the models and their columns.
+    """
+    if not isinstance(content, dict):
+        return {}
+
+    models: List[Dict[str, Any]] = []
+    for model in content.get("models", None) or []:
+        columns = [
+            {key: column[key] for key in COLUMN_KEYS_TO_INDEX if key in column}
+            for column in model.get("columns", None) or []
+        ]
+        models.append({"name": model["name"], "columns": columns})
+    return {"models": models}
+
+
+def parse_schema_file(path: Path) -> Dict[str, Any]:
+    """Parses a schema file and summarises its content. Module level so it can be pickled.
+
+    The summary is extracted from the parse events of the file and only falls back to loading
+    the whole file for documents the extractor can't read the same way.
+    """
+    try:
+        with open(path, "r") as stream:
+            return extract_schema_summary(stream, COLUMN_KEYS_TO_INDEX)
+    except UnsupportedSchemaDocumentError as error:
+        logger.debug(f"{path} is fully loaded: {error}")
+    return summarise_schema_content(open_yaml(path))
+
+
+def parse_schema_files(paths: Sequence[Path], jobs: int = 1) -> List[Dict[str, Any]]:
+    """Parses schema files, in a pool of `jobs` processes when more than one job is asked for.
+
+    Args:
+        paths (Sequence[Path]): Paths to the schema files to parse.
+        jobs (int, optional): Number of processes to parse the files with. Defaults to 1.
+
+    Returns:
+        List[Dict[str, Any]]: Summarised content of each file in the same order as `paths`.
+    """
+    if jobs > 1 and len(paths) > 1:
+        workers = min(jobs, len(paths))
+        logger.debug(f"Parsing {len(paths)} schema files with {workers} processes.")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Executor.map returns results in the order of its inputs whatever the completion order.
+            return list(
+                executor.map(
+                    parse_schema_file, paths, chunksize=max(1, len(paths) // (workers * 4))
+                )
+            )
+    return [parse_schema_file(path) for path in paths]
+
+
+class SchemaFileIndex:
+    """Holds the summarised content of schema files and persists it in the dbt project.
+
+    Files are considered unchanged when their mtime and size match what was recorded. When they
+    don't, the content hash is checked before falling back to a full parse of the file.
+    """
+
+    def __init__(self, repository_path: Path, is_enabled: bool = True) -> None:
+        """Constructor for SchemaFileIndex.
+
+        Args:
+            repository_path (Path): Path to the dbt project in which the index is stored.
+            is_enabled (bool, optional): When False the index is neither read nor persisted, files
+                are then only remembered for the duration of the run. Defaults to True.
+        """
+        self._index_path = Path(repository_path, CACHE_FOLDER, SCHEMA_INDEX_FILENAME)
+        self._is_enabled = is_enabled
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seen_paths: Set[str] = set()
+        self._is_dirty = False
+        # only read once a file is looked up so that runs which never need it do not pay for it.
+        self._is_loaded = False
+
+    def load(self) -> None:
+        """Reads the index from disk. A missing, corrupt or outdated index is simply ignored."""
+        self._is_loaded = True
+        if not self._index_path.is_file():
+            return
+        try:
+            with open(self._index_path, "r") as stream:
+                index = json.load(stream)
+        except (OSError, ValueError):
+            logger.debug(f"Could not read the schema index at {self._index_path}, rebuilding it.")
+            return
+        if index.get("version") != SCHEMA_INDEX_FORMAT_VERSION:
+            logger.debug("The schema index was written by another version of dbt-sugar.")
+            return
+        self._entries = index.get("files", {})
+
+    def get_content(self, path: Path) -> Dict[str, Any]:
+        """Returns the summarised content of a schema file, parsing it only when it changed.
+
+        Args:
+            path (Path): Path to the schema file.
+
+        Returns:
+            Dict[str, Any]: Summarised content of the schema file.
+        """
+        return self.get_contents([path])[0]
+
+    def get_contents(
+        self, paths: Sequence[Path], jobs: int = 1, must_mention: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Returns the summarised content of schema files, only parsing the ones that changed.
+
+        Args:
+            paths (Sequence[Path]): Paths to the schema files.
+            jobs (int, optional): Number of processes used to parse the changed files. Defaults to 1.
+            must_mention (Optional[Iterable[str]], optional): When given, changed files whose raw
+                text contains none of these words, whatever their case, are not parsed and come
+                back empty.
+
+        Returns:
+            List[Dict[str, Any]]: Summarised content of each file in the same order as `paths`.
+        """
+        if self._is_enabled and not self._is_loaded:
+            self.load()
+        prefilter = None
+        if must_mention is not None:
+            prefilter = RawTextPrefilter(must_mention, ignore_case=True, whole_words=False)
+        contents: Dict[Path, Dict[str, Any]] = {}
+        paths_to_parse = []
+        for path in paths:
+            content = self._get_indexed_content(path)
+            if content is not None:
+                contents[path] = content
+            elif prefilter is not None and not prefilter.might_mention(path):
+                # the file was not parsed so we must not keep an entry for it.
+                self._entries.pop(os.path.abspath(path), None)
+                contents[path] = {}
+            else:
+                paths_to_parse.append(path)
+
+        for path, content in zip(paths_to_parse, parse_schema_files(paths_to_parse, jobs=jobs)):
+            self._index_content(path, content)
+            contents[path] = content
+        return [contents[path] for path in paths]
+
+    def _get_indexed_content(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Returns the indexed content of a file when it is still up to date, None otherwise."""
+        key = os.path.abspath(path)
+        self._seen_paths.add(key)
+        stat = os.stat(path)
+        entry = self._entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["content"]
+
+        if not self._is_enabled:
+            # nothing is persisted but an unchanged file is still only parsed once per run.
+            self._entries[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "content": None,
+            }
+            return None
+
+        with open(path, "rb") as stream:
+            content_hash = hashlib.sha1(stream.read()).hexdigest()
+        fingerprint = {"hash": content_hash, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        if entry and entry["hash"] == content_hash:
+            # the file was touched but not modified, we only need to refresh its fingerprint.
+            logger.debug(f"{path} was touched but its content is unchanged.")
+            entry.update(fingerprint)
+            self._is_dirty = True
+            return entry["content"]
+
+        logger.debug(f"{path} is new or was modified, parsing it.")
+        self._entries[key] = dict(fingerprint, content=None)
+        return None
+
+    def _index_content(self, path: Path, content: Dict[str, Any]) -> None:
+        self._entries[os.path.abspath(path)]["content"] = content
+        self._is_dirty = True
+
+    def save(self) -> None:
+        """Writes the index to disk dropping entries of files which were not seen in this run."""
+        if not self._is_enabled:
+            return
+        stale_paths = set(self._entries) - self._seen_paths
+        for stale_path in stale_paths:
+            del self._entries[stale_path]
+        if not (self._is_dirty or stale_paths):
+            return
+
+        tmp_index_path = self._index_path.with_suffix(".tmp")
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_index_path, "w") as stream:
+                json.dump(
+                    {"version": SCHEMA_INDEX_FORMAT_VERSION, "files": self._entries},
+                    stream,
+                    default=str,
+                )
+            os.replace(tmp_index_path, self._index_path)
+            self._is_dirty = False
+        except OSError as error:
+            logger.debug(f"Could not write the schema index to {self._index_path}: {error}")
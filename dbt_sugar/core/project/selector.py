@@ -0,0 +1,152 @@
+"""Resolves model selectors such as `stg_*`, `models/staging` or `tag:finance` into model names.
+
+Selectors follow what dbt users already type in `dbt run --select`:
+    - a model name, which may hold `*`, `?` and `[...]` wildcards e.g. `stg_*`,
+    - a folder or file path relative to the root of the dbt project e.g. `models/staging`, which
+      may hold wildcards too, or explicitly `path:models/staging`,
+    - `tag:<tag>` for the models carrying a tag,
+    - any of the above with graph operators: `+orders` adds the models `orders` is built from,
+      `orders+` the models built from it and `2+orders+1` limits how many levels are followed.
+Selectors joined by a comma select the models matching all of them e.g. `tag:finance,models/marts`
+and separate selectors select the union of the models each of them selects.
+"""
+import fnmatch
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from dbt_sugar.core.exceptions import InvalidSelectorError
+from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+from dbt_sugar.core.project.graph import ModelGraph
+from dbt_sugar.core.project.inventory import ProjectInventory
+
+TAG_METHOD = "tag"
+PATH_METHOD = "path"
+SELECTOR_METHODS = (TAG_METHOD, PATH_METHOD)
+_GRAPH_OPERATORS = re.compile(
+    r"^(?:(?P<parents_depth>\d*)(?P<parents>\+))?(?P<selector>.*?)"
+    r"(?:(?P<children>\+)(?P<children_depth>\d*))?$"
+)
+
+
+class ModelSelector:
+    """Picks the models of a project matching selectors, in the order the project is walked."""
+
+    def __init__(
+        self,
+        repository_path: Union[str, Path],
+        project_inventory: ProjectInventory,
+        get_tags_by_model: Callable[[], Dict[str, Set[str]]],
+        get_model_graph: Optional[Callable[[], ModelGraph]] = None,
+    ) -> None:
+        """Constructor for ModelSelector.
+
+        Args:
+            repository_path (Union[str, Path]): Path to the dbt project.
+            project_inventory (ProjectInventory): Inventory of the project's files.
+            get_tags_by_model (Callable[[], Dict[str, Set[str]]]): Returns the tags of each model,
+                only called when a tag selector is used.
+            get_model_graph (Optional[Callable[[], ModelGraph]], optional): Returns the lineage of
+                the models, only called when a graph operator is used. Defaults to None in which
+                case graph operators are refused.
+        """
+        self.repository_path = repository_path
+        self._project_inventory = project_inventory
+        self._get_tags_by_model = get_tags_by_model
+        self._get_model_graph = get_model_graph
+        self._tags_by_model: Optional[Dict[str, Set[str]]] = None
+        self._model_graph: Optional[ModelGraph] = None
+
+    @property
+    def model_paths(self) -> Dict[str, str]:
+        """`/` separated path of each model file relative to the project root, in walk order."""
+        return {
+            model_file.stem: Path(os.path.relpath(model_file, self.repository_path)).as_posix()
+            for model_file in self._project_inventory.model_files
+        }
+
+    def select(self, selectors: Iterable[str]) -> List[str]:
+        """Returns the names of the models matching any of the selectors.
+
+        Args:
+            selectors (Iterable[str]): Selectors as typed by the user, a selector holding spaces
+                is read as several selectors.
+
+        Raises:
+            InvalidSelectorError: When a selector uses a method or an operator we can't resolve.
+
+        Returns:
+            List[str]: Names of the selected models in the order the project is walked.
+        """
+        model_paths = self.model_paths
+        selected_models: Set[str] = set()
+        for selector in (selector for selectors_ in selectors for selector in selectors_.split()):
+            matches: Optional[Set[str]] = None
+            for atom in selector.split(","):
+                atom_matches = self._select_with_graph_operators(atom, model_paths)
+                matches = atom_matches if matches is None else matches & atom_matches
+            if not matches:
+                logger.warning(f"[yellow]The selector '{selector}' does not match any model.")
+            selected_models.update(matches or ())
+        return [model_name for model_name in model_paths if model_name in selected_models]
+
+    def _select_with_graph_operators(self, selector: str, model_paths: Dict[str, str]) -> Set[str]:
+        operators = _GRAPH_OPERATORS.match(selector)
+        if not operators or not operators.group("selector"):
+            raise InvalidSelectorError(f"'{selector}' is not a valid selector.")
+        matches = self._select_one(operators.group("selector"), model_paths)
+        if not (operators.group("parents") or operators.group("children")):
+            return matches
+
+        model_graph = self._get_graph(selector)
+        selected_models = set(matches)
+        if operators.group("parents"):
+            depth = operators.group("parents_depth")
+            selected_models |= model_graph.upstream(matches, int(depth) if depth else None)
+        if operators.group("children"):
+            depth = operators.group("children_depth")
+            selected_models |= model_graph.downstream(matches, int(depth) if depth else None)
+        return selected_models
+
+    def _select_one(self, selector: str, model_paths: Dict[str, str]) -> Set[str]:
+        method, separator, value = selector.partition(":")
+        if separator:
+            if method not in SELECTOR_METHODS:
+                raise InvalidSelectorError(
+                    f"'{selector}' uses an unknown selector method, use one of {SELECTOR_METHODS}."
+                )
+            if method == PATH_METHOD:
+                return self._select_path(value, model_paths)
+            return {
+                model_name
+                for model_name in model_paths
+                if any(fnmatch.fnmatchcase(tag, value) for tag in self._get_model_tags(model_name))
+            }
+        if "/" in selector or os.sep in selector or Path(self.repository_path, selector).is_dir():
+            return self._select_path(selector, model_paths)
+        return {
+            model_name for model_name in model_paths if fnmatch.fnmatchcase(model_name, selector)
+        }
+
+    @staticmethod
+    def _select_path(selector: str, model_paths: Dict[str, str]) -> Set[str]:
+        path_pattern = Path(selector).as_posix().strip("/")
+        return {
+            model_name
+            for model_name, model_path in model_paths.items()
+            if model_path.startswith(f"{path_pattern}/")
+            or fnmatch.fnmatchcase(model_path, path_pattern)
+        }
+
+    def _get_model_tags(self, model_name: str) -> Set[str]:
+        if self._tags_by_model is None:
+            self._tags_by_model = self._get_tags_by_model()
+        return self._tags_by_model.get(model_name, set())
+
+    def _get_graph(self, selector: str) -> ModelGraph:
+        if self._model_graph is None:
+            if self._get_model_graph is None:
+                raise InvalidSelectorError(f"Graph operators can't be used here: '{selector}'.")
+            self._model_graph = self._get_model_graph()
+        return self._model_graph
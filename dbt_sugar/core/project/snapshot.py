@@ -0,0 +1,130 @@
+"""Binary snapshot of what dbt-sugar knows about a project once all its schema files are merged.
+
+Even when no schema file needs to be parsed again, merging the content of thousands of them into
+the descriptions, tests and column indexes takes a while. The merged state is dumped at the end of
+a run and the next run loads it back as is, as long as the fingerprint it was saved with (file
+stats gathered by the inventory walk, dbt-sugar settings...) still matches.
+
+Snapshots are serialised with `marshal`: it is the fastest serialiser of builtin types shipped
+with Python and, unlike `pickle`, loading a file found in the project folder can't run code.
+"""
+import marshal
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from dbt_sugar.core._version import __version__
+from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+from dbt_sugar.core.project.schema_index import CACHE_FOLDER
+
+SNAPSHOT_FILENAME = "project_snapshot.bin"
+SNAPSHOT_MAGIC = b"DBTSUGAR"
+# bump this whenever the shape of what we store in the snapshot changes.
+SNAPSHOT_FORMAT_VERSION = 1
+# magic, snapshot format version and marshal format version.
+_HEADER = struct.Struct("<8sHH")
+
+
+def to_builtins(value: Any) -> Any:
+    """Turns ordered dicts, paths and other non builtin containers into what marshal can dump.
+
+    Args:
+        value (Any): Value made of mappings, sequences, strings, numbers, booleans and None.
+
+    Returns:
+        Any: The same value made of dicts, lists and tuples only.
+    """
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    if isinstance(value, Mapping):
+        return {to_builtins(key): to_builtins(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(to_builtins(item) for item in value)
+    if isinstance(value, (list, set, frozenset)):
+        return [to_builtins(item) for item in value]
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    return str(value)
+
+
+def stat_fingerprint(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    """Modification time and size of a file or None when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ProjectSnapshot:
+    """Reads and writes the snapshot of a project's merged state in its cache folder.
+
+    A snapshot is only handed back when it was written by the same snapshot and marshal formats
+    and the same dbt-sugar version for the exact same fingerprint. Anything else, a truncated or
+    corrupt file included, is treated as a missing snapshot.
+    """
+
+    def __init__(self, repository_path: Union[str, Path], is_enabled: bool = True) -> None:
+        """Constructor for ProjectSnapshot.
+
+        Args:
+            repository_path (Union[str, Path]): Path to the dbt project in which the snapshot is
+                stored.
+            is_enabled (bool, optional): When False snapshots are neither read nor written.
+                Defaults to True.
+        """
+        self.snapshot_path = Path(repository_path, CACHE_FOLDER, SNAPSHOT_FILENAME)
+        self.is_enabled = is_enabled
+
+    def load(self, fingerprint: Any) -> Optional[Any]:
+        """Loads the state saved for a fingerprint.
+
+        Args:
+            fingerprint (Any): Builtin value describing everything the state was built from.
+
+        Returns:
+            Optional[Any]: The saved state or None when there is no valid snapshot for the
+                fingerprint.
+        """
+        if not self.is_enabled or not self.snapshot_path.is_file():
+            return None
+        try:
+            with open(self.snapshot_path, "rb") as stream:
+                header = stream.read(_HEADER.size)
+                if header != _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, marshal.version):
+                    logger.debug(f"{self.snapshot_path} has an unknown format, it is ignored.")
+                    return None
+                version, saved_fingerprint, state = marshal.load(stream)
+        except (OSError, EOFError, ValueError, TypeError) as error:
+            logger.debug(f"Could not read the project snapshot at {self.snapshot_path}: {error}")
+            return None
+        if version != __version__ or saved_fingerprint != to_builtins(fingerprint):
+            logger.debug("The project changed since its snapshot was taken.")
+            return None
+        logger.debug(f"Loaded the project state from {self.snapshot_path}")
+        return state
+
+    def save(self, fingerprint: Any, state: Any) -> None:
+        """Saves the state built for a fingerprint, replacing any previous snapshot.
+
+        The snapshot is written next to its final location first so that a run killed half way
+        never leaves a truncated snapshot behind.
+
+        Args:
+            fingerprint (Any): Builtin value describing everything the state was built from.
+            state (Any): State to save, it must only hold values `marshal` can dump.
+        """
+        if not self.is_enabled:
+            return
+        temporary_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.tmp")
+        try:
+            serialized_state = marshal.dumps((__version__, to_builtins(fingerprint), state))
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, "wb") as stream:
+                stream.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, marshal.version))
+                stream.write(serialized_state)
+            os.replace(temporary_path, self.snapshot_path)
+        except (OSError, ValueError) as error:
+            logger.debug(f"Could not save the project snapshot at {self.snapshot_path}: {error}")
@@ -6,7 +6,6 @@ from rich import box
 from rich.console import Console
 from rich.table import Table
 
-from dbt_sugar.core.clients.yaml_helpers import open_yaml
 from dbt_sugar.core.config.config import DbtSugarConfig
 from dbt_sugar.core.flags import FlagParser
 from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
@@ -32,23 +31,50 @@ class AuditTask(BaseTask):
 
     def run(self) -> int:
         """Main script to run the command doc"""
+        if getattr(self._flags, "select", None):
+            return self.audit_selected_models()
         if self.model_name:
             _ = self.is_exluded_model(self.model_name)
-            logger.info(f"Running audit of model [bold magenta]{self.model_name}.[/bold magenta]\n")
-            path_file, schema_exists, _ = self.find_model_schema_file(self.model_name)
-            if not path_file:
-                logger.info(f"Could not find {self.model_name} in the project at {self.dbt_path}")
-                return 1
-            if not schema_exists:
-                logger.info("The model is not documented.")
-                return 1
-            self.model_content = open_yaml(path_file)
-            self.derive_model_coverage()
-        else:
-            logger.info(f"Running audit of dbt project in {self.dbt_path}.\n")
-            self.derive_project_coverage()
+            return self.audit_model(self.model_name)
+        logger.info(f"Running audit of dbt project in {self.dbt_path}.\n")
+        self.derive_project_coverage()
         return 0
 
+    def audit_model(self, model_name: str) -> int:
+        """Audits the coverage of a single model.
+
+        Args:
+            model_name (str): Name of the model to audit.
+
+        Returns:
+            int: with the status of the execution. 1 when the model is not documented.
+        """
+        self.model_name = model_name
+        logger.info(f"Running audit of model [bold magenta]{model_name}.[/bold magenta]\n")
+        path_file, schema_exists, _ = self.find_model_schema_file(model_name)
+        if not path_file:
+            logger.info(f"Could not find {model_name} in the project at {self.dbt_path}")
+            return 1
+        if not schema_exists:
+            logger.info("The model is not documented.")
+            return 1
+        self.model_content = self._schema_index.get_content(path_file)
+        self.derive_model_coverage()
+        return 0
+
+    def audit_selected_models(self) -> int:
+        """Audits every model matching the `--select` selectors, the project is only loaded once.
+
+        Returns:
+            int: with the status of the execution. 1 when a model is not documented.
+        """
+        model_names = self.select_models(self._flags.select)
+        if not model_names:
+            logger.error("[red]No model of your dbt project matches the selection.")
+            return 1
+        exit_codes = [self.audit_model(model_name) for model_name in model_names]
+        return max(exit_codes)
+
     def derive_model_coverage(self) -> None:
         """Method to get the coverage from a specific model."""
         self.get_model_column_description_coverage()
@@ -58,6 +84,7 @@ class AuditTask(BaseTask):
         """Method to get the coverage from a dbt project."""
         self.get_project_column_description_coverage()
         self.get_project_test_coverage()
+        self.get_project_description_conflicts()
 
     def calculate_coverage_percentage(self, misses: int, total: int) -> str:
         """
@@ -94,9 +121,9 @@ class AuditTask(BaseTask):
 
         for column in columns:
             model_number_columns += 1
-            if len(column["tests"]) == 0:
+            if len(column.tests) == 0:
                 model_columns_without_tests += 1
-                untested_columns.append(column["name"])
+                untested_columns.append(column.name)
 
         percentage_not_tested_columns = self.calculate_coverage_percentage(
             misses=model_columns_without_tests, total=model_number_columns
@@ -207,7 +234,7 @@ class AuditTask(BaseTask):
                 total_number_columns += 1
                 model_number_columns += 1
 
-                if len(column["tests"]) == 0:
+                if len(column.tests) == 0:
                     number_columns_without_tests += 1
                     model_columns_without_tests += 1
 
@@ -230,7 +257,8 @@ class AuditTask(BaseTask):
         """Method to get the model descriptions coverage per model in a dbt project."""
         print_statistics = {}
         for model_name, path in self.all_dbt_models.items():
-            content = open_yaml(path)
+            # the models and columns of the file are all we need, not its whole content.
+            content = self._schema_index.get_content(path)
 
             number_documented_columns = len(
                 self.get_documented_columns(
@@ -260,6 +288,24 @@ class AuditTask(BaseTask):
             data=print_statistics,
         )
 
+    def get_project_description_conflicts(self) -> None:
+        """Method to list the columns which are described differently across models."""
+        conflicts = self.column_index.conflicts
+        if not conflicts:
+            return
+
+        print_statistics = {
+            column_name: str(len(descriptions)) for column_name, descriptions in conflicts.items()
+        }
+        print_statistics[""] = ""
+        print_statistics["Total"] = str(self.column_index.conflicts_count)
+
+        self.create_table(
+            title=f"Description Conflicts (resolved with {self.column_index.policy})",
+            columns=["Column Name", "Descriptions"],
+            data=print_statistics,
+        )
+
     def get_project_total_test_coverage(self) -> str:
         """
         Method to get the descriptions coverage for an entire dbt project.
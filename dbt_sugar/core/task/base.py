@@ -1,19 +1,36 @@
 """API definition for Task-like objects."""
 import abc
 import os
-import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from dbt_sugar.core.clients.yaml_helpers import open_yaml, save_yaml
+from dbt_sugar.core.clients.manifest import DEFAULT_MANIFEST_PATH
+from dbt_sugar.core.clients.yaml_helpers import clear_yaml_cache, open_yaml, save_yaml
 from dbt_sugar.core.config.config import DbtSugarConfig
+from dbt_sugar.core.exceptions import MissingManifestError, YAMLFileEmptyError
 from dbt_sugar.core.flags import FlagParser
 from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
+from dbt_sugar.core.project.column_index import (
+    DEFAULT_CONFLICT_POLICY,
+    MOST_RECENT,
+    ColumnDescriptionIndex,
+)
+from dbt_sugar.core.project.column_names import ColumnNameIndex, ColumnNameNormalizer
+from dbt_sugar.core.project.graph import ModelGraph
+from dbt_sugar.core.project.inventory import (
+    DEFAULT_EXCLUDED_PATHS,
+    PathExclusionRules,
+    ProjectInventory,
+)
+from dbt_sugar.core.project.manifest_loader import ManifestProjectLoader
+from dbt_sugar.core.project.prefilter import RawTextPrefilter
+from dbt_sugar.core.project.records import ColumnTests, intern_string
+from dbt_sugar.core.project.schema_index import SchemaFileIndex
+from dbt_sugar.core.project.selector import ModelSelector
+from dbt_sugar.core.project.snapshot import ProjectSnapshot, stat_fingerprint, to_builtins
 
 COLUMN_NOT_DOCUMENTED = "No description for this column."
 MODEL_NOT_DOCUMENTED = "No description for this model."
-DEFAULT_EXCLUDED_FOLDERS_PATTERN = r"\/target\/|\/dbt_modules\/"
-DEFAULT_EXCLUDED_YML_FILES = r"dbt_project.yml|packages.yml"
 
 
 class BaseTask(abc.ABC):
@@ -23,27 +40,68 @@ class BaseTask(abc.ABC):
         self.repository_path = dbt_path
         self._sugar_config = sugar_config
         self._flags = flags
+        # files parsed by a previous task of this process may have been changed since.
+        clear_yaml_cache()
 
         # populated by class methods
-        self._excluded_folders_from_search_pattern: str = self.setup_paths_exclusion()
+        self._path_exclusion_rules = self.setup_paths_exclusion()
+        self._project_inventory: Optional[ProjectInventory] = None
+        self._jobs: int = getattr(flags, "jobs", 1)
+        self._schema_index = SchemaFileIndex(
+            self.repository_path, is_enabled=getattr(flags, "use_cache", True)
+        )
+        self._project_snapshot = ProjectSnapshot(
+            self.repository_path, is_enabled=getattr(flags, "use_cache", True)
+        )
         self.all_dbt_models: Dict[str, Path] = {}
         self.dbt_definitions: Dict[str, str] = {}
-        self.dbt_tests: Dict[str, List[Dict[str, Any]]] = {}
-        self.build_descriptions_dictionary()
-
-    def setup_paths_exclusion(self) -> str:
-        """Appends excluded_folders to the default folder exclusion patten."""
-        if self._sugar_config.dbt_project_info["excluded_folders"]:
-            excluded_folders_from_search_pattern: str = r"\/|\/".join(
-                self._sugar_config.dbt_project_info["excluded_folders"]
+        self.column_index = ColumnDescriptionIndex(
+            COLUMN_NOT_DOCUMENTED,
+            policy=self._sugar_config.dbt_project_info.get("description_conflict_policy")
+            or DEFAULT_CONFLICT_POLICY,
+        )
+        self.column_names = ColumnNameIndex(
+            ColumnNameNormalizer(
+                prefixes=self._sugar_config.dbt_project_info.get("column_name_prefixes") or [],
+                suffixes=self._sugar_config.dbt_project_info.get("column_name_suffixes") or [],
             )
-            excluded_folders_from_search_pattern = (
-                fr"{DEFAULT_EXCLUDED_FOLDERS_PATTERN}|\/{excluded_folders_from_search_pattern}\/"
+        )
+        self.dbt_tests: Dict[str, List[ColumnTests]] = {}
+        # column name -> schema files declaring it, excluded models included.
+        self.schema_files_by_column: Dict[str, List[Path]] = {}
+        self._is_descriptions_dictionary_built = False
+        # lazy runs only load what the model they work on needs, see `load_model_descriptions`.
+        if not getattr(flags, "lazy", False):
+            self.build_descriptions_dictionary()
+
+    @property
+    def repository_path(self) -> Union[str, Path]:
+        return self._repository_path
+
+    @repository_path.setter
+    def repository_path(self, path: Union[str, Path]) -> None:
+        # the inventory of a previous path would be wrong so we drop it.
+        self._repository_path = path
+        self._project_inventory = None
+
+    @property
+    def project_inventory(self) -> ProjectInventory:
+        """Inventory of the schema and model files of the project, built on first access."""
+        if self._project_inventory is None:
+            self._project_inventory = ProjectInventory(
+                self.repository_path, self._path_exclusion_rules
             )
-            return excluded_folders_from_search_pattern
-        else:
-            excluded_folders_from_search_pattern = DEFAULT_EXCLUDED_FOLDERS_PATTERN
-            return excluded_folders_from_search_pattern
+        return self._project_inventory
+
+    def setup_paths_exclusion(self) -> PathExclusionRules:
+        """Appends excluded_folders to the default paths exclusion patterns.
+
+        Entries of excluded_folders can be folder names or any `.gitignore`-style pattern.
+        """
+        excluded_folders = self._sugar_config.dbt_project_info["excluded_folders"] or []
+        if isinstance(excluded_folders, str):
+            excluded_folders = [excluded_folders]
+        return PathExclusionRules(DEFAULT_EXCLUDED_PATHS + excluded_folders)
 
     def get_column_description_from_dbt_definitions(self, column_name: str) -> str:
         """Searches for the description of a column in all the descriptions in DBT.
@@ -51,10 +109,36 @@ class BaseTask(abc.ABC):
         Args:
             column_name (str): column name to get the description from.
 
+        Names which only differ by their case, style (snake or camel case) or by one of the
+        configured prefixes and suffixes share their description e.g. `CUSTOMER_ID`, `customerId`.
+
         Returns:
             str: with the description of the column.
         """
-        return self.dbt_definitions.get(column_name, COLUMN_NOT_DOCUMENTED)
+        description = self.dbt_definitions.get(column_name)
+        # an undocumented exact match, e.g. the placeholder we write, must not hide another style.
+        if not description or description == COLUMN_NOT_DOCUMENTED:
+            project_column_name = self.column_names.find(column_name)
+            if project_column_name is not None:
+                description = self.dbt_definitions.get(project_column_name) or description
+        return description or COLUMN_NOT_DOCUMENTED
+
+    def suggest_column_descriptions(self, column_name: str, limit: int = 3) -> Dict[str, str]:
+        """Looks for descriptions of columns with a name similar to `column_name`.
+
+        Args:
+            column_name (str): column name to find similar columns for.
+            limit (int, optional): maximum number of suggestions. Defaults to 3.
+
+        Returns:
+            Dict[str, str]: documented columns with a similar name and their descriptions.
+        """
+        suggestions = {}
+        for similar_column_name in self.column_names.suggest(column_name, limit=limit):
+            description = self.dbt_definitions.get(similar_column_name, COLUMN_NOT_DOCUMENTED)
+            if similar_column_name != column_name and description != COLUMN_NOT_DOCUMENTED:
+                suggestions[similar_column_name] = description
+        return suggestions
 
     def get_documented_columns(self, content: Dict[str, Any], model_name: str) -> Dict[str, str]:
         """Method to get the documented columns from a model in a schema.yml.
@@ -120,7 +204,7 @@ class BaseTask(abc.ABC):
         path_file: Path,
         model_name: str,
         dict_column_description_to_update: Dict[str, Dict[str, Any]],
-    ):
+    ) -> bool:
         """
         Method to update a schema.yml with a Dict of columns names, tests, and tags.
 
@@ -129,8 +213,12 @@ class BaseTask(abc.ABC):
             model_name (str): Name of the model to update.
             dict_column_description_to_update (Dict[str, Dict[str, Any]]): Dict with the column name with
             the description, tags and tests to update.
+
+        Returns:
+            bool: True when the schema.yml had to be written.
         """
         content = open_yaml(path_file)
+        is_modified = False
         for model in content.get("models", []):
             if model["name"] == model_name:
                 for column in model.get("columns", []):
@@ -140,35 +228,42 @@ class BaseTask(abc.ABC):
                         description = dict_column_description_to_update[column_name].get(
                             "description"
                         )
-                        if description:
+                        if description and column.get("description") != description:
                             column["description"] = description
-
-                        # Update the tests without duplicating them.
-                        tests = dict_column_description_to_update[column_name].get("tests")
-                        if tests:
-                            column["tests"] = self.__combine_two_list_without_duplicates(
-                                column.get("tests", []), tests
+                            is_modified = True
+
+                        # Update the tests and the tags without duplicating them.
+                        for key in ("tests", "tags"):
+                            values = dict_column_description_to_update[column_name].get(key)
+                            if not values:
+                                continue
+                            combined_values = self.__combine_two_list_without_duplicates(
+                                column.get(key, []), values
                             )
-
-                        # Update the tags without duplicating them.
-                        tags = dict_column_description_to_update[column_name].get("tags")
-                        if tags:
-                            column["tags"] = self.__combine_two_list_without_duplicates(
-                                column.get("tags", []), tags
-                            )
-        save_yaml(path_file, content)
+                            if column.get(key) != combined_values:
+                                column[key] = combined_values
+                                is_modified = True
+        if not is_modified:
+            return False
+        return save_yaml(path_file, content)
 
     def update_column_description_from_schema(
         self, path_file: Path, dict_column_description_to_update: Dict[str, Dict[str, Any]]
-    ) -> None:
+    ) -> bool:
         """Method to update a schema.yml with a Dict of columns names and description.
 
+        The file is only serialised and written when one of its descriptions actually changes.
+
         Args:
             path_file (Path): Path to the schema.yml file to update the columns descriptions from.
             dict_column_description_to_update (Dict[str, Dict[str, Any]]): Dict with the column name with
             the description to update.
+
+        Returns:
+            bool: True when the schema.yml had to be written.
         """
         content = open_yaml(path_file)
+        is_modified = False
         for model in content.get("models", []):
             for column in model.get("columns", []):
                 column_name = column["name"]
@@ -176,9 +271,12 @@ class BaseTask(abc.ABC):
                     new_desctiption = dict_column_description_to_update[column_name].get(
                         "description"
                     )
-                    if new_desctiption:
+                    if new_desctiption and column.get("description") != new_desctiption:
                         column["description"] = new_desctiption
-        save_yaml(path_file, content)
+                        is_modified = True
+        if not is_modified:
+            return False
+        return save_yaml(path_file, content)
 
     def update_column_descriptions(
         self, dict_column_description_to_update: Dict[str, Dict[str, Any]]
@@ -189,19 +287,35 @@ class BaseTask(abc.ABC):
             dict_column_description_to_update (Dict[str, Dict[str, Any]]): Dict with the column name with
             the description to update.
         """
-        for root, _, files in os.walk(self.repository_path):
-            if not re.search(self._excluded_folders_from_search_pattern, root):
-                files = [
-                    f
-                    for f in files
-                    if f.lower().endswith(".yml")
-                    and not re.search(DEFAULT_EXCLUDED_YML_FILES, f.lower())
-                ]
-                for file in files:
-                    path_file = Path(os.path.join(root, file))
-                    self.update_column_description_from_schema(
-                        path_file, dict_column_description_to_update
-                    )
+        updated_files = 0
+        for path_file in self.get_schema_files_with_columns(dict_column_description_to_update):
+            if self.update_column_description_from_schema(
+                path_file, dict_column_description_to_update
+            ):
+                updated_files += 1
+        logger.debug(f"Updated descriptions in {updated_files} schema files.")
+
+    def get_schema_files_with_columns(self, column_names: Iterable[str]) -> List[Path]:
+        """Lists the schema files which declare at least one of the given columns.
+
+        The reverse index built while loading the project is used when the whole project was
+        loaded. Otherwise the raw bytes of each schema file are scanned for the column names and
+        only the files which could declare one of them are returned.
+
+        Args:
+            column_names (Iterable[str]): Names of the columns to look for.
+
+        Returns:
+            List[Path]: Paths to the schema files in the order the project is walked.
+        """
+        schema_files = self.project_inventory.schema_files
+        if not self._is_descriptions_dictionary_built:
+            prefilter = RawTextPrefilter(column_names)
+            return [path_file for path_file in schema_files if prefilter.might_mention(path_file)]
+        candidate_files: Set[Path] = set()
+        for column_name in column_names:
+            candidate_files.update(self.schema_files_by_column.get(column_name, ()))
+        return [path_file for path_file in schema_files if path_file in candidate_files]
 
     def update_test_in_dbt_tests(self, model_name: str, column: Dict[str, Any]) -> None:
         """Update a column tests in the global tests dictionary.
@@ -210,27 +324,46 @@ class BaseTask(abc.ABC):
             model_name (str): with the model name.
             column (Dict[str, Any]): column information.
         """
-        if model_name not in self.dbt_tests:
-            self.dbt_tests[model_name] = [
-                {"name": column["name"], "tests": column.get("tests", [])}
-            ]
-        else:
-            self.dbt_tests[model_name].append(
-                {"name": column["name"], "tests": column.get("tests", [])}
-            )
+        self.dbt_tests.setdefault(intern_string(model_name), []).append(
+            ColumnTests(column["name"], column.get("tests", ()))
+        )
 
     def update_description_in_dbt_descriptions(
-        self, column_name: str, column_description: str
+        self,
+        column_name: str,
+        column_description: str,
+        model_name: str = "",
+        modification_time_ns: int = 0,
     ) -> None:
         """Update a column description in the global description dictionary.
 
+        Every description met is recorded in the column index and the dictionary holds the one
+        picked by the description conflict policy.
+
         Args:
             column_name (str): column name to update.
             column_description (str): column description to update.
+            model_name (str, optional): name of the model the column belongs to.
+            modification_time_ns (int, optional): modification time of the model's schema file.
         """
         if not column_description:
             column_description = COLUMN_NOT_DOCUMENTED
-        self.dbt_definitions[column_name] = column_description
+        column_name = intern_string(column_name)
+        self.dbt_definitions[column_name] = self.column_index.add(
+            column_name, column_description, model_name, modification_time_ns
+        )
+        self.column_names.add(
+            column_name, is_documented=self.dbt_definitions[column_name] != COLUMN_NOT_DOCUMENTED
+        )
+
+    def _get_modification_time_ns(self, path_file: Path) -> int:
+        """Modification time of a schema file, only looked up when the conflict policy needs it."""
+        if self.column_index.policy != MOST_RECENT:
+            return 0
+        try:
+            return os.stat(path_file).st_mtime_ns
+        except OSError:
+            return 0
 
     def remove_excluded_models(self, content: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         """Removes models that are excluded_models from the models dict"""
@@ -260,36 +393,197 @@ class BaseTask(abc.ABC):
         """
         if not content:
             return
+        # propagation updates excluded models too so they are indexed before being filtered out.
+        for model in content.get("models", None) or []:
+            for column in model.get("columns", None) or []:
+                schema_files = self.schema_files_by_column.setdefault(column["name"], [])
+                if not schema_files or schema_files[-1] != path_schema:
+                    schema_files.append(path_schema)
         models = self.remove_excluded_models(content)
         if not models:
             return
+        modification_time_ns = self._get_modification_time_ns(path_schema)
         for model in models:
             self.all_dbt_models[model["name"]] = path_schema
             for column in model.get("columns", []):
                 column_description = column.get("description", None)
-                self.update_description_in_dbt_descriptions(column["name"], column_description)
+                self.update_description_in_dbt_descriptions(
+                    column["name"], column_description, model["name"], modification_time_ns
+                )
                 self.update_test_in_dbt_tests(model["name"], column)
 
+    def index_saved_schema_file(self, path_schema: Path, content: Dict[str, Any]) -> None:
+        """Adds a schema file this task just wrote to the knowledge of the project.
+
+        Models documented later in the same run must find the columns it now declares, and the
+        file itself when it was just created, when they propagate their descriptions.
+
+        Args:
+            path_schema (Path): Path to the schema.yml which was saved.
+            content (Dict[str, Any]): content of the schema.yml as it was saved.
+        """
+        if path_schema not in self.project_inventory.schema_files:
+            # walked again the next time it is needed.
+            self._project_inventory = None
+        for model in content.get("models", None) or []:
+            for column in model.get("columns", None) or []:
+                schema_files = self.schema_files_by_column.setdefault(column["name"], [])
+                if path_schema not in schema_files:
+                    schema_files.append(path_schema)
+
+    def get_project_fingerprint(self) -> Tuple[Any, ...]:
+        """Everything the merged state of the project is built from, file stats included.
+
+        The stats come from the inventory walk so checking that nothing changed since the project
+        snapshot was taken costs no more than that walk.
+        """
+        dbt_project_info = self._sugar_config.dbt_project_info
+        return (
+            self.project_inventory.file_fingerprints,
+            stat_fingerprint(Path(self.repository_path, "dbt_project.yml")),
+            stat_fingerprint(Path(self.repository_path, DEFAULT_MANIFEST_PATH)),
+            dbt_project_info.get("excluded_models"),
+            dbt_project_info.get("column_name_prefixes"),
+            dbt_project_info.get("column_name_suffixes"),
+            self.column_index.policy,
+        )
+
+    def _save_project_snapshot(self, fingerprint: Tuple[Any, ...]) -> None:
+        """Saves the merged state of the project, paths are stored once and referenced by index."""
+        path_indexes: Dict[Path, int] = {}
+
+        def index_of(path_file: Path) -> int:
+            if path_file not in path_indexes:
+                path_indexes[path_file] = len(path_indexes)
+            return path_indexes[path_file]
+
+        state = {
+            "all_dbt_models": {
+                model_name: index_of(path_file)
+                for model_name, path_file in self.all_dbt_models.items()
+            },
+            "schema_files_by_column": {
+                column_name: [index_of(path_file) for path_file in schema_files]
+                for column_name, schema_files in self.schema_files_by_column.items()
+            },
+            "dbt_definitions": self.dbt_definitions,
+            "dbt_tests": {
+                model_name: [
+                    (column_tests.name, to_builtins(column_tests.tests))
+                    for column_tests in model_tests
+                ]
+                for model_name, model_tests in self.dbt_tests.items()
+            },
+            "column_index": self.column_index.to_snapshot(),
+            "column_names": self.column_names.to_snapshot(),
+        }
+        state["paths"] = [
+            os.path.relpath(path_file, self.repository_path) for path_file in path_indexes
+        ]
+        self._project_snapshot.save(fingerprint, state)
+
+    def _load_project_snapshot(self, fingerprint: Tuple[Any, ...]) -> bool:
+        """Restores the merged state of the project saved by a previous run when still valid.
+
+        Returns:
+            bool: True when the state was restored.
+        """
+        state = self._project_snapshot.load(fingerprint)
+        if state is None:
+            return False
+        paths = [Path(self.repository_path, path_file) for path_file in state["paths"]]
+        self.all_dbt_models = {
+            model_name: paths[path_index]
+            for model_name, path_index in state["all_dbt_models"].items()
+        }
+        self.schema_files_by_column = {
+            column_name: [paths[path_index] for path_index in path_indexes]
+            for column_name, path_indexes in state["schema_files_by_column"].items()
+        }
+        self.dbt_definitions = state["dbt_definitions"]
+        self.dbt_tests = {
+            model_name: [ColumnTests.restore(name, tests) for name, tests in model_tests]
+            for model_name, model_tests in state["dbt_tests"].items()
+        }
+        self.column_index.load_snapshot(state["column_index"])
+        self.column_names.load_snapshot(state["column_names"])
+        self._is_descriptions_dictionary_built = True
+        return True
+
     def build_descriptions_dictionary(self) -> None:
         """Load the columns descriptions from all schema files in a dbt project.
 
         This is purely responsble for building the knowledge of all possible definitions.
         In other words it is independent from the documentation orchestration.
         This happens in the `doc` task
+
+        When nothing changed since the previous run, the state it merged is loaded from the
+        project snapshot instead.
         """
-        for root, _, files in os.walk(self.repository_path):
-            if not re.search(self._excluded_folders_from_search_pattern, root):
-                files = [
-                    f
-                    for f in files
-                    if f.lower().endswith(".yml")
-                    and not re.search(DEFAULT_EXCLUDED_YML_FILES, f.lower())
-                ]
-                for file in files:
-                    path_file = Path(os.path.join(root, file))
-                    content = open_yaml(path_file)
-                    logger.debug(path_file)
-                    self.load_descriptions_from_a_schema_file(content, path_file)
+        fingerprint = self.get_project_fingerprint()
+        if self._load_project_snapshot(fingerprint):
+            return
+        schema_contents = ManifestProjectLoader(
+            self.repository_path, self.project_inventory, self._path_exclusion_rules
+        ).get_schema_contents()
+        if schema_contents is not None:
+            logger.debug("Loading models, descriptions and tests from the dbt manifest.")
+        else:
+            schema_files = self.project_inventory.schema_files
+            contents = self._schema_index.get_contents(schema_files, jobs=self._jobs)
+            schema_contents = list(zip(schema_files, contents))
+            self._schema_index.save()
+
+        # merging happens serially in path order so that the last definition of a column wins
+        # exactly like it would without parallel parsing.
+        for path_file, content in schema_contents:
+            logger.debug(path_file)
+            self.load_descriptions_from_a_schema_file(content, path_file)
+        self._is_descriptions_dictionary_built = True
+        self._save_project_snapshot(fingerprint)
+
+    def load_model_descriptions(self, model_name: str, column_names: Iterable[str]) -> None:
+        """Loads only what documenting a model needs when the full dictionary was not built.
+
+        That is the schema file the model is declared in and the descriptions of the given
+        columns, or of the columns which normalise like them. Schema files are still merged in
+        path order so the result is the same as what `build_descriptions_dictionary` gives for
+        those names, but unchanged files are served from the schema index and changed ones are
+        only parsed when their text mentions the model or a part of one of the column names.
+
+        Args:
+            model_name (str): Name of the model to document.
+            column_names (Iterable[str]): Names of the columns of the model.
+        """
+        if self._is_descriptions_dictionary_built:
+            return
+        # a snapshot of the whole project is cheaper to load than parsing even a few files.
+        if self._load_project_snapshot(self.get_project_fingerprint()):
+            return
+        normalize = self.column_names.normalizer.normalize
+        normalized_names = {normalize(column_name) for column_name in column_names}
+        # the longest part of a normalised name is found in every spelling of that name.
+        words = {max(name.split("_"), key=len) for name in normalized_names} | {model_name}
+        schema_files = self.project_inventory.schema_files
+        contents = self._schema_index.get_contents(
+            schema_files, jobs=self._jobs, must_mention=words
+        )
+        self._schema_index.save()
+
+        for path_file, content in zip(schema_files, contents):
+            models = self.remove_excluded_models(content) or []
+            modification_time_ns = self._get_modification_time_ns(path_file) if models else 0
+            for model in models:
+                if model["name"] == model_name:
+                    self.all_dbt_models[model_name] = path_file
+                for column in model.get("columns", []):
+                    if normalize(column["name"]) in normalized_names:
+                        self.update_description_in_dbt_descriptions(
+                            column["name"],
+                            column.get("description", None),
+                            model["name"],
+                            modification_time_ns,
+                        )
 
     def is_model_in_schema_content(self, content, model_name) -> bool:
         """Method to check if a model exists in a schema.yaml content.
@@ -310,40 +604,102 @@ class BaseTask(abc.ABC):
         return False
 
     def find_model_schema_file(self, model_name: str) -> Tuple[Optional[Path], bool, bool]:
-        for root, _, files in os.walk(self.repository_path):
-            if not re.search(self._excluded_folders_from_search_pattern, root):
-                schema_file_path = None
-                model_file_found = False
-                schema_file_exists = False
-                is_already_documented = False
-                for file in files:
-                    # check the model file exists and if it does return the path
-                    # of the schema.yml it's in.
-                    if file == f"{model_name}.sql":
-                        model_file_found = True
-                        logger.debug(f"Found sql file for '{model_name}'")
-                        schema_file_path = self.all_dbt_models.get(model_name, None)
-                    # if it's not in a schema file, then it's not documented and we
-                    # need to create a schema.yml "dummy" to place it in.
-                    if not schema_file_path and model_file_found:
-                        logger.debug(
-                            f"'{model_name}' was not contained in a schema file. Creating one at {root}"
-                        )
-                        schema_file_path = Path(os.path.join(root, "schema.yml"))
-                        # check whether there is a schema file already present
-                        schema_file_exists = False
-                        if schema_file_path.exists():
-                            schema_file_exists = True
-                        return schema_file_path, schema_file_exists, is_already_documented
-
-                    if schema_file_path and model_file_found:
-                        logger.debug(
-                            f"'{model_name}' found in '{schema_file_path}' we'll update entry."
-                        )
-                        is_already_documented = True
-                        schema_file_exists = True
-                        return schema_file_path, schema_file_exists, is_already_documented
-        return None, False, False
+        # check the model file exists and if it does return the path
+        # of the schema.yml it's in.
+        model_file = self.project_inventory.get_model_file(model_name)
+        if not model_file:
+            return None, False, False
+        logger.debug(f"Found sql file for '{model_name}'")
+
+        schema_file_path = self.all_dbt_models.get(model_name, None)
+        # if it's not in a schema file, then it's not documented and we
+        # need to create a schema.yml "dummy" to place it in.
+        if not schema_file_path:
+            schema_file_path = model_file.parent.joinpath("schema.yml")
+            logger.debug(
+                f"'{model_name}' was not contained in a schema file. Creating one at {schema_file_path}"
+            )
+            # check whether there is a schema file already present
+            return schema_file_path, schema_file_path.exists(), False
+
+        logger.debug(f"'{model_name}' found in '{schema_file_path}' we'll update entry.")
+        return schema_file_path, True, True
+
+    def get_tags_by_model(self) -> Dict[str, Set[str]]:
+        """Returns the tags of each model of the project.
+
+        Tags are read from the dbt manifest when it is up to date as it also knows the tags set
+        in `dbt_project.yml` and in `config()` blocks. Otherwise only the tags set in schema files
+        are known.
+        """
+        manifest_loader = ManifestProjectLoader(
+            self.repository_path, self.project_inventory, self._path_exclusion_rules
+        )
+        if manifest_loader.is_manifest_fresh():
+            try:
+                return {
+                    node["name"]: set(node.get("tags") or [])
+                    for _, node in manifest_loader.manifest.iter_nodes(
+                        resource_types=("model",), fields=("name", "tags")
+                    )
+                }
+            except (KeyError, ValueError, OSError) as error:
+                logger.debug(f"Could not read the tags from the manifest: {error!r}")
+        logger.debug("Reading the model tags from the schema files, run `dbt compile` to get all.")
+
+        tags_by_model: Dict[str, Set[str]] = {}
+        for path_file in self.project_inventory.schema_files:
+            try:
+                content = open_yaml(path_file)
+            except YAMLFileEmptyError:
+                continue
+            for model in content.get("models", None) or []:
+                model_tags = tags_by_model.setdefault(model["name"], set())
+                for tags in (model.get("tags"), (model.get("config") or {}).get("tags")):
+                    if isinstance(tags, str):
+                        tags = [tags]
+                    model_tags.update(tags or [])
+        return tags_by_model
+
+    def get_model_graph(self) -> ModelGraph:
+        """Returns the lineage of the models of the project as recorded in the dbt manifest.
+
+        Raises:
+            MissingManifestError: When dbt has not written a manifest for the project yet.
+        """
+        manifest_loader = ManifestProjectLoader(
+            self.repository_path, self.project_inventory, self._path_exclusion_rules
+        )
+        if not manifest_loader.manifest.exists():
+            raise MissingManifestError(
+                f"Graph selectors need the dbt manifest but {manifest_loader.manifest.manifest_path} "
+                "does not exist. Run `dbt compile` first."
+            )
+        if not manifest_loader.is_manifest_fresh():
+            logger.warning(
+                "[yellow]Your project changed since the dbt manifest was written, the lineage used "
+                "to select models might be outdated. Run `dbt compile` to refresh it."
+            )
+        return ModelGraph.from_manifest(manifest_loader.manifest)
+
+    def select_models(self, selectors: Iterable[str]) -> List[str]:
+        """Returns the names of the models matching any of the selectors, excluded ones left out.
+
+        Args:
+            selectors (Iterable[str]): Model names, globs, paths or `tag:` selectors with dbt's
+                graph operators, see `ModelSelector`.
+
+        Returns:
+            List[str]: Names of the selected models in the order the project is walked.
+        """
+        selected_models = ModelSelector(
+            self.repository_path,
+            self.project_inventory,
+            self.get_tags_by_model,
+            self.get_model_graph,
+        ).select(selectors)
+        excluded_models = self._sugar_config.dbt_project_info.get("excluded_models") or []
+        return [model_name for model_name in selected_models if model_name not in excluded_models]
 
     def is_exluded_model(self, model_name: str) -> bool:
         if model_name in self._sugar_config.dbt_project_info.get("excluded_models", []):
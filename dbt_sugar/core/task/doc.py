@@ -1,20 +1,22 @@
 """Document Task module."""
-import copy
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import BarColumn, Progress
+from sqlalchemy.exc import DBAPIError, NoSuchTableError
 
 from dbt_sugar.core.clients.dbt import DbtProfile
 from dbt_sugar.core.clients.yaml_helpers import open_yaml, save_yaml
-from dbt_sugar.core.config.config import DbtSugarConfig
+from dbt_sugar.core.config.config import DEFAULT_SAMPLE_SIZE, DbtSugarConfig
+from dbt_sugar.core.connectors.base import DEFAULT_POOL_SIZE
 from dbt_sugar.core.connectors.postgres_connector import PostgresConnector
 from dbt_sugar.core.connectors.snowflake_connector import SnowflakeConnector
 from dbt_sugar.core.flags import FlagParser
 from dbt_sugar.core.logger import GLOBAL_LOGGER as logger
-from dbt_sugar.core.task.base import MODEL_NOT_DOCUMENTED, BaseTask
+from dbt_sugar.core.task.base import COLUMN_NOT_DOCUMENTED, MODEL_NOT_DOCUMENTED, BaseTask
 from dbt_sugar.core.ui.cli_ui import UserInputCollector
 
 console = Console()
@@ -39,6 +41,11 @@ class DocumentationTask(BaseTask):
         self.column_update_payload: Dict[str, Dict[str, Any]] = {}
         self._flags = flags
         self._dbt_profile = dbt_profile
+        self._test_threads: int = getattr(flags, "test_threads", 1)
+        self._count_failures: bool = getattr(flags, "count_failures", False)
+        self._test_sample_size: Optional[int] = None
+        if getattr(flags, "sample_tests", False):
+            self._test_sample_size = config.config.get("test_sample_size", DEFAULT_SAMPLE_SIZE)
         # self._sugar_config = config
 
     def run(self) -> int:
@@ -55,7 +62,16 @@ class DocumentationTask(BaseTask):
                 f"Connector '{dbt_credentials.get('type')}' is not implemented."
             )
 
-        self.connector = connector(dbt_credentials)
+        # each thread checking tests holds a connection of the pool while its query runs.
+        self.connector = connector(
+            dbt_credentials,
+            pool_size=max(self._test_threads, DEFAULT_POOL_SIZE),
+            count_failures=self._count_failures,
+            sample_size=self._test_sample_size,
+        )
+
+        if self._flags.select:
+            return self.document_selected_models(schema)
 
         # exit early if model is in the excluded_models list
         _ = self.is_exluded_model(model)
@@ -64,6 +80,59 @@ class DocumentationTask(BaseTask):
             return self.orchestrate_model_documentation(schema, model, columns_sql)
         return 1
 
+    def document_selected_models(self, schema: str) -> int:
+        """Documents every model matching the `--select` selectors in a single run.
+
+        All the models share the knowledge of the project, which is only loaded once, and the
+        connection pool of the connector. Models which can't be found in the database are skipped.
+
+        Args:
+            schema (str): Name of the schema where the models live.
+
+        Returns:
+            int: with the status of the execution. 1 when a model could not be documented.
+        """
+        model_names = self.select_models(self._flags.select)
+        if not model_names:
+            logger.error("[red]No model of your dbt project matches the selection.")
+            return 1
+        logger.info(f"Documenting {len(model_names)} models.")
+        # building the whole knowledge once beats loading it piecemeal for each model.
+        if len(model_names) > 1 and not self._is_descriptions_dictionary_built:
+            self.build_descriptions_dictionary()
+
+        failed_models = []
+        for model_position, model_name in enumerate(model_names):
+            columns_sql: Optional[List[Any]] = None
+            try:
+                columns_sql = self.connector.get_columns_from_table(model_name, schema)
+            except NoSuchTableError:
+                # reported below like a table without any column.
+                pass
+            if not columns_sql:
+                logger.warning(
+                    f"[yellow]'{model_name}' could not be found in the '{schema}' schema of "
+                    "your database, it is skipped."
+                )
+                failed_models.append(model_name)
+                continue
+            # what the user entered for a model must not leak into the next one.
+            self.column_update_payload = {}
+            try:
+                if self.orchestrate_model_documentation(schema, model_name, columns_sql):
+                    failed_models.append(model_name)
+            except KeyboardInterrupt:
+                logger.warning(
+                    f"[yellow]Stopped before documenting: {', '.join(model_names[model_position:])}"
+                )
+                return 1
+
+        logger.info(f"Documented {len(model_names) - len(failed_models)} models.")
+        if failed_models:
+            logger.warning(f"[yellow]Could not document: {', '.join(failed_models)}")
+            return 1
+        return 0
+
     def update_model_description(
         self, content: Dict[str, Any], model_name: str, is_already_documented: bool = False
     ) -> Dict[str, Any]:
@@ -111,7 +180,9 @@ class DocumentationTask(BaseTask):
         """
         # DEPRECATION: Drop ordered dict when dropping python 3.6 support
         ordered_dict = OrderedDict(model)
-        ordered_dict.move_to_end("description", last=False)
+        # models and columns created outside of dbt-sugar might not have a description.
+        if "description" in ordered_dict:
+            ordered_dict.move_to_end("description", last=False)
         ordered_dict.move_to_end("name", last=False)
         return ordered_dict
 
@@ -160,6 +231,8 @@ class DocumentationTask(BaseTask):
             - Gives the user the posibility to document the undocumented columns.
             - Updates all the new columns definitions in all dbt.
 
+        In non-interactive runs only the first step happens, with the descriptions already known.
+
         Args:
             model_name (str): Name of the model to document.
             columns_sql (List[str]): Columns names that the model have in the database.
@@ -168,6 +241,7 @@ class DocumentationTask(BaseTask):
             int: with the status of the execution. 1 for fail, and 0 for ok!
         """
         content = None
+        self.load_model_descriptions(model_name, columns_sql)
         schema_file_path, schema_exists, is_already_documented = self.find_model_schema_file(
             model_name
         )
@@ -182,6 +256,11 @@ class DocumentationTask(BaseTask):
         content = self.create_or_update_model_entry(
             is_already_documented, content, model_name, columns_sql
         )
+        if getattr(self._flags, "is_non_interactive", False):
+            save_yaml(schema_file_path, self.order_schema_yml(content))
+            self.all_dbt_models[model_name] = schema_file_path
+            self.index_saved_schema_file(schema_file_path, content)
+            return 0
         try:
             content = self.update_model_description(content, model_name, is_already_documented)
 
@@ -192,10 +271,14 @@ class DocumentationTask(BaseTask):
             self.document_columns(documented_columns, "documented_columns")
         except KeyboardInterrupt:
             logger.info("The user has exited the doc task, all changes have been discarded.")
+            # the models left in a `--select` run must not be documented either.
+            if getattr(self._flags, "select", None):
+                raise
             return 0
-        print(f"content about to be saved {content}")
-        print(f"column_update_payload: {self.column_update_payload}")
+        logger.debug(f"content about to be saved {content}")
+        logger.debug(f"column_update_payload: {self.column_update_payload}")
         save_yaml(schema_file_path, self.order_schema_yml(content))
+        self.index_saved_schema_file(schema_file_path, content)
         self.check_tests(schema, model_name)
         self.update_model_description_test_tags(
             schema_file_path, model_name, self.column_update_payload
@@ -210,11 +293,25 @@ class DocumentationTask(BaseTask):
         Method to run and add test into a schema.yml, this method will:
 
         Run the tests and if they have been successful it will add them into the schema.yml.
+        All the tests are checked by a single scan of the model. When the database can't run that
+        query, e.g. a column type can't be compared for uniqueness, up to `--test-threads` tests
+        run at once instead. Results are reported column after column in the order of the
+        schema.yml either way, with the number of failing rows when `--count-failures` is used.
+        With `--sample` tests only check a sample of the model, which is said of the tests passing.
 
         Args:
             schema (str): Name of the schema where the model lives.
             model_name (str): Name of the model to document.
         """
+        tests_to_run = [
+            (column, test)
+            for column, column_payload in self.column_update_payload.items()
+            for test in column_payload.get("tests", [])
+        ]
+        tests_left_by_column = {column: 0 for column in self.column_update_payload}
+        for column, _ in tests_to_run:
+            tests_left_by_column[column] += 1
+
         with Progress(
             "[progress.description]{task.description}",
             BarColumn(),
@@ -224,29 +321,82 @@ class DocumentationTask(BaseTask):
             test_checking_task = progress.add_task(
                 "[bold] checking your tests...", total=len(self.column_update_payload.keys())
             )
-            for column in self.column_update_payload.keys():
-                tests = self.column_update_payload[column].get("tests", [])
-                tests_ = copy.deepcopy(tests)
-                for test in tests_:
-                    has_passed = self.connector.run_test(
-                        test,
-                        schema,
-                        model_name,
-                        column,
-                    )
-                    message = self._generate_test_success_message(test, column, has_passed)
-                    progress.console.log(message)
-                    if not has_passed:
-                        tests.remove(test)
-                progress.advance(test_checking_task)
+            # columns without tests are done already.
+            progress.advance(
+                test_checking_task, sum(1 for tests in tests_left_by_column.values() if not tests)
+            )
+            failed_tests = []
+            for (column, test), failures in zip(
+                tests_to_run, self._run_tests(schema, model_name, tests_to_run)
+            ):
+                message = self._generate_test_success_message(
+                    test,
+                    column,
+                    not failures,
+                    failures if self._count_failures else None,
+                    self._test_sample_size,
+                )
+                progress.console.log(message)
+                if failures:
+                    failed_tests.append((column, test))
+                tests_left_by_column[column] -= 1
+                if not tests_left_by_column[column]:
+                    progress.advance(test_checking_task)
+
+        for column, test in failed_tests:
+            self.column_update_payload[column]["tests"].remove(test)
+
+    def _run_tests(
+        self, schema: str, model_name: str, tests_to_run: List[Tuple[str, str]]
+    ) -> Iterator[int]:
+        """Yields the number of failures of each test, in the order of `tests_to_run`."""
+        if not tests_to_run:
+            return
+        try:
+            results = self.connector.count_tests_failures(schema, model_name, tests_to_run)
+        except DBAPIError as error:
+            logger.debug(
+                f"The tests of {model_name} could not be checked in one query, they are checked "
+                f"one by one instead: {error}"
+            )
+        else:
+            yield from results
+            return
+
+        if self._test_threads <= 1 or len(tests_to_run) <= 1:
+            for column, test in tests_to_run:
+                yield self.connector.count_test_failures(test, schema, model_name, column)
+            return
+        with ThreadPoolExecutor(max_workers=min(self._test_threads, len(tests_to_run))) as pool:
+            # map hands the results back in submission order, whichever test finishes first.
+            yield from pool.map(
+                lambda column_test: self.connector.count_test_failures(
+                    column_test[1], schema, model_name, column_test[0]
+                ),
+                tests_to_run,
+            )
 
     @staticmethod
-    def _generate_test_success_message(test_name: str, column_name: str, has_passed: bool):
+    def _generate_test_success_message(
+        test_name: str,
+        column_name: str,
+        has_passed: bool,
+        failures: Optional[int] = None,
+        sample_size: Optional[int] = None,
+    ):
+        if has_passed and sample_size is not None:
+            return (
+                f"The [bold]{test_name}[/bold] test on '{column_name}' [green]PASSED on sample"
+                f"[/green] of about {sample_size} rows, it was not checked on the whole model."
+            )
         if has_passed:
             return f"The [bold]{test_name}[/bold] test on '{column_name}' [green]PASSED"
+        on_rows = f" on {failures} rows" if failures is not None else ""
+        if failures is not None and sample_size is not None:
+            on_rows += " of the sample"
         return (
-            f"The [bold]{test_name}[/bold] test on '{column_name}' [red]FAILED[/red]. \n\t└[bold]It will not be added "
-            "to your schema.yml.[/bold]"
+            f"The [bold]{test_name}[/bold] test on '{column_name}' [red]FAILED[/red]{on_rows}. "
+            "\n\t└[bold]It will not be added to your schema.yml.[/bold]"
         )
 
     def document_columns(
@@ -334,10 +484,28 @@ class DocumentationTask(BaseTask):
                     columns_names = [column["name"] for column in columns]
                     if column not in columns_names:
                         description = self.get_column_description_from_dbt_definitions(column)
+                        self.log_description_suggestions(column, description)
                         logger.info(f"Updating column '{column.lower()}'")
                         columns.append({"name": column, "description": description})
         return content
 
+    def log_description_suggestions(self, column_name: str, description: str) -> None:
+        """Lists the descriptions of similarly named columns when a column has none.
+
+        Args:
+            column_name (str): Name of the column.
+            description (str): Description the column was given.
+        """
+        if description != COLUMN_NOT_DOCUMENTED:
+            return
+        for similar_column_name, similar_description in self.suggest_column_descriptions(
+            column_name
+        ).items():
+            logger.info(
+                f"'{column_name}' is not documented, '{similar_column_name}' which looks "
+                f"similar is described as: {similar_description}"
+            )
+
     def create_new_model(
         self, content: Optional[Dict[str, Any]], model_name: str, columns_sql: List[str]
     ) -> Dict[str, Any]:
@@ -355,6 +523,7 @@ class DocumentationTask(BaseTask):
         columns = []
         for column_sql in columns_sql:
             description = self.get_column_description_from_dbt_definitions(column_sql)
+            self.log_description_suggestions(column_sql, description)
             columns.append({"name": column_sql, "description": description})
         model = {
             "name": model_name,